@@ -4,6 +4,7 @@ from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy import text
 
 from alembic import context
 
@@ -16,6 +17,11 @@ sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), ".."
 from app.database import Base  # noqa: E402
 from app.core.config import settings  # noqa: E402
 
+# Fail fast instead of queueing DDL behind long-running transactions.
+# These are session-level, so revisions build indexes concurrently inside
+# concurrent_index_block(), which lifts them for the build.
+from app.core.migration_ops import MIGRATION_TIMEOUTS  # noqa: E402
+
 target_metadata = Base.metadata
 
 
@@ -33,6 +39,9 @@ def run_migrations_offline() -> None:
     )
 
     with context.begin_transaction():
+        if url.startswith("postgresql"):
+            for statement in MIGRATION_TIMEOUTS:
+                context.execute(statement)
         context.run_migrations()
 
 
@@ -50,6 +59,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            for statement in MIGRATION_TIMEOUTS:
+                connection.execute(text(statement))
+            connection.commit()
+
         context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
@@ -8,6 +8,7 @@ Create Date: 2025-10-22 13:00:00.000000
 
 from alembic import op
 import sqlalchemy as sa
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
 
 # revision identifiers, used by Alembic.
 revision = "3bff5f5bc4c8"
@@ -16,34 +17,43 @@ branch_labels = None
 depends_on = None
 
 
+def _has_session_id_column() -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns("messages")
+    return any(column["name"] == "session_id" for column in columns)
+
+
 def upgrade():
     # Add the session_id column to messages table
-    op.add_column(
-        "messages",
-        sa.Column(
-            "session_id",
-            sa.Integer(),
-            sa.ForeignKey("chat_sessions.id"),
-            nullable=True,
-        ),
-    )
-    # Create index for session_id
-    op.create_index(
-        op.f("ix_messages_session_id"), "messages", ["session_id"], unique=False
-    )
+    if not _has_session_id_column():
+        op.add_column(
+            "messages",
+            sa.Column(
+                "session_id",
+                sa.Integer(),
+                sa.ForeignKey("chat_sessions.id"),
+                nullable=True,
+            ),
+        )
+    # Create index for session_id without blocking writes to messages
+    with concurrent_index_block():
+        create_index_concurrently(
+            op.f("ix_messages_session_id"),
+            "messages",
+            ["session_id"],
+            unique=False,
+        )
 
 
 def downgrade():
     # Drop index for session_id if it exists
-    try:
-        op.drop_index(op.f("ix_messages_session_id"), table_name="messages")
-    except Exception:
-        # Index might not exist from previous migration runs
-        pass
+    with concurrent_index_block():
+        op.drop_index(
+            op.f("ix_messages_session_id"),
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
 
     # Drop session_id column from messages table if it exists
-    try:
+    if _has_session_id_column():
         op.drop_column("messages", "session_id")
-    except Exception:
-        # Column might not exist from previous migration runs
-        pass
@@ -0,0 +1,35 @@
+"""Drop redundant idx_token_jti index
+
+Revision ID: 4c1d7a2b9e60
+Revises: b8d5f2a6c3e9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "4c1d7a2b9e60"
+down_revision = "b8d5f2a6c3e9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The unique constraint on token_jti already provides the lookup index.
+    with concurrent_index_block():
+        op.drop_index(
+            "idx_token_jti",
+            table_name="token_blacklist",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            "idx_token_jti",
+            "token_blacklist",
+            ["token_jti"],
+        )
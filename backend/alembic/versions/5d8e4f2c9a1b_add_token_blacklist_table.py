@@ -8,6 +8,7 @@ Create Date: 2025-10-31 12:00:00.000000
 
 from alembic import op
 import sqlalchemy as sa
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
 
 # revision identifiers, used by Alembic.
 revision = "token_blacklist_table"
@@ -15,6 +16,12 @@ down_revision = "3bff5f5bc4c8"
 branch_labels = None
 depends_on = None
 
+# token_jti needs no extra index: the unique constraint already creates one.
+_INDEXES = (
+    ("idx_user_id", "user_id"),
+    ("idx_expires_at", "expires_at"),
+)
+
 
 def upgrade() -> None:
     # Create token_blacklist table
@@ -70,13 +77,28 @@ def upgrade() -> None:
             comment="When token naturally expires",
         ),
         sa.PrimaryKeyConstraint("id"),
-        sa.Index("idx_token_jti", "token_jti"),
-        sa.Index("idx_user_id", "user_id"),
-        sa.Index("idx_expires_at", "expires_at"),
         sa.UniqueConstraint("token_jti"),
     )
 
+    # CONCURRENTLY cannot run inside a transaction block, so the indexes are
+    # created separately from the table.
+    with concurrent_index_block():
+        for name, column in _INDEXES:
+            create_index_concurrently(
+                name,
+                "token_blacklist",
+                [column],
+            )
+
 
 def downgrade() -> None:
+    with concurrent_index_block():
+        for name, _ in _INDEXES:
+            op.drop_index(
+                name,
+                table_name="token_blacklist",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
     # Drop token_blacklist table
     op.drop_table("token_blacklist")
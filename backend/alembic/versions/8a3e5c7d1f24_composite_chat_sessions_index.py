@@ -0,0 +1,53 @@
+"""Replace chat_sessions single-column indexes with a composite index
+
+Revision ID: 8a3e5c7d1f24
+Revises: 4c1d7a2b9e60
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "8a3e5c7d1f24"
+down_revision = "4c1d7a2b9e60"
+branch_labels = None
+depends_on = None
+
+_LEGACY_COLUMNS = ("id", "title", "user_id", "created_at", "updated_at")
+
+
+def upgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            "ix_chat_sessions_user_created",
+            "chat_sessions",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+        )
+        for column in _LEGACY_COLUMNS:
+            op.drop_index(
+                op.f(f"ix_chat_sessions_{column}"),
+                table_name="chat_sessions",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade():
+    with concurrent_index_block():
+        for column in _LEGACY_COLUMNS:
+            create_index_concurrently(
+                op.f(f"ix_chat_sessions_{column}"),
+                "chat_sessions",
+                [column],
+                unique=False,
+            )
+        op.drop_index(
+            "ix_chat_sessions_user_created",
+            table_name="chat_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,64 @@
+"""Make search_history unique per (user_id, search_type, query)
+
+Revision ID: a7c4e1f9b2d6
+Revises: f6b3d0e4a8c5
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "a7c4e1f9b2d6"
+down_revision = "f6b3d0e4a8c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # search_history predates the migration history on some installs
+    if not sa.inspect(op.get_bind()).has_table("search_history"):
+        return
+    op.execute(
+        "UPDATE search_history SET search_type = 'general' WHERE search_type IS NULL"
+    )
+    # Keep only the newest row of each repeated query
+    op.execute(
+        "DELETE FROM search_history a USING search_history b "
+        "WHERE a.user_id = b.user_id AND a.search_type = b.search_type "
+        "AND a.query = b.query AND a.id < b.id"
+    )
+    with concurrent_index_block():
+        create_index_concurrently(
+            "uq_search_history_user_query",
+            "search_history",
+            ["user_id", "search_type", "query"],
+            unique=True,
+        )
+        # user_id is the leading column of the unique index
+        op.drop_index(
+            op.f("ix_search_history_user_id"),
+            table_name="search_history",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    if not sa.inspect(op.get_bind()).has_table("search_history"):
+        return
+    with concurrent_index_block():
+        create_index_concurrently(
+            op.f("ix_search_history_user_id"),
+            "search_history",
+            ["user_id"],
+            unique=False,
+        )
+        op.drop_index(
+            "uq_search_history_user_query",
+            table_name="search_history",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Drop redundant ix_*_id indexes on primary-key columns
+
+Revision ID: b6f0d2e4a8c1
+Revises: 8a3e5c7d1f24
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "b6f0d2e4a8c1"
+down_revision = "8a3e5c7d1f24"
+branch_labels = None
+depends_on = None
+
+# Every one of these tables already has a unique B-tree on ``id`` from its
+# primary key constraint.
+_TABLES = (
+    "users",
+    "messages",
+    "user_api_keys",
+    "user_mcp_servers",
+    "user_memories",
+    "session_documents",
+    "document_chunks",
+)
+
+
+def upgrade():
+    with concurrent_index_block():
+        for table in _TABLES:
+            op.drop_index(
+                op.f(f"ix_{table}_id"),
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade():
+    with concurrent_index_block():
+        for table in _TABLES:
+            create_index_concurrently(
+                op.f(f"ix_{table}_id"),
+                table,
+                ["id"],
+                unique=False,
+            )
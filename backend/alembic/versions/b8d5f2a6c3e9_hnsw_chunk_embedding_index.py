@@ -0,0 +1,59 @@
+"""Add an HNSW index on document_chunks.embedding
+
+Revision ID: b8d5f2a6c3e9
+Revises: 7e2f4b9a1c3d
+Create Date: 2026-10-16 00:00:00.000000
+
+Approximate nearest-neighbour index for the RAG service's
+cosine_distance() searches. Skipped when cbdc66c5ab65 fell back to an
+ARRAY column because pgvector was missing; ARRAY has no operator class
+for it.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "b8d5f2a6c3e9"
+down_revision = "7e2f4b9a1c3d"
+branch_labels = None
+depends_on = None
+
+
+def _embedding_is_vector(conn) -> bool:
+    return (
+        conn.execute(
+            sa.text(
+                "SELECT count(*) FROM information_schema.columns "
+                "WHERE table_name = 'document_chunks' "
+                "AND column_name = 'embedding' AND udt_name = 'vector'"
+            )
+        ).scalar()
+        > 0
+    )
+
+
+def upgrade():
+    if not _embedding_is_vector(op.get_bind()):
+        return
+    with concurrent_index_block():
+        create_index_concurrently(
+            "ix_chunks_embedding_hnsw",
+            "document_chunks",
+            ["embedding"],
+            unique=False,
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        )
+
+
+def downgrade():
+    with concurrent_index_block():
+        op.drop_index(
+            "ix_chunks_embedding_hnsw",
+            table_name="document_chunks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
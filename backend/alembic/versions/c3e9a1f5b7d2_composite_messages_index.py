@@ -0,0 +1,51 @@
+"""Replace ix_messages_user_id with a (user_id, created_at DESC) index
+
+Revision ID: c3e9a1f5b7d2
+Revises: b6f0d2e4a8c1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "c3e9a1f5b7d2"
+down_revision = "b6f0d2e4a8c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            "ix_messages_user_created",
+            "messages",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_include=["session_id"],
+        )
+        # user_id is the leading column of the new index
+        op.drop_index(
+            op.f("ix_messages_user_id"),
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            op.f("ix_messages_user_id"),
+            "messages",
+            ["user_id"],
+            unique=False,
+        )
+        op.drop_index(
+            "ix_messages_user_created",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -56,9 +56,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["message_id"], ["messages.id"], ondelete="SET NULL"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        op.f("ix_session_documents_id"), "session_documents", ["id"], unique=False
-    )
 
     op.create_table(
         "document_chunks",
@@ -78,13 +75,8 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        op.f("ix_document_chunks_id"), "document_chunks", ["id"], unique=False
-    )
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_document_chunks_id"), table_name="document_chunks")
     op.drop_table("document_chunks")
-    op.drop_index(op.f("ix_session_documents_id"), table_name="session_documents")
     op.drop_table("session_documents")
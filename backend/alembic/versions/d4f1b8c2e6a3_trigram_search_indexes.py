@@ -0,0 +1,68 @@
+"""Add pg_trgm GIN indexes for message and session search
+
+Revision ID: d4f1b8c2e6a3
+Revises: c3e9a1f5b7d2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "d4f1b8c2e6a3"
+down_revision = "c3e9a1f5b7d2"
+branch_labels = None
+depends_on = None
+
+# Search ORs both columns of each table, so both sides need an index for
+# the planner to use a BitmapOr instead of a sequential scan. These live
+# only in migrations: create_all runs before the extension exists.
+_INDEXES = (
+    ("ix_messages_content_trgm", "messages", "content"),
+    ("ix_messages_response_trgm", "messages", "response"),
+    ("ix_chat_sessions_title_trgm", "chat_sessions", "title"),
+    ("ix_chat_sessions_description_trgm", "chat_sessions", "description"),
+)
+
+
+def _trgm_available(conn) -> bool:
+    return (
+        conn.execute(
+            sa.text(
+                "SELECT count(*) FROM pg_available_extensions WHERE name = 'pg_trgm'"
+            )
+        ).scalar()
+        > 0
+    )
+
+
+def upgrade():
+    if not _trgm_available(op.get_bind()):
+        print("Warning: pg_trgm not available; search will use sequential scans.")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with concurrent_index_block():
+        for name, table, column in _INDEXES:
+            create_index_concurrently(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade():
+    # The extension is left installed; other objects may depend on it
+    with concurrent_index_block():
+        for name, table, _ in _INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,54 @@
+"""Make user_api_keys unique per (user_id, model_name)
+
+Revision ID: e5a2c9d3f7b4
+Revises: d4f1b8c2e6a3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "e5a2c9d3f7b4"
+down_revision = "d4f1b8c2e6a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the newest key where a set/set race left duplicates
+    op.execute(
+        "DELETE FROM user_api_keys a USING user_api_keys b "
+        "WHERE a.user_id = b.user_id AND a.model_name = b.model_name "
+        "AND a.id < b.id"
+    )
+    with concurrent_index_block():
+        create_index_concurrently(
+            "uq_user_api_keys_user_model",
+            "user_api_keys",
+            ["user_id", "model_name"],
+            unique=True,
+        )
+        # user_id is the leading column of the unique index
+        op.drop_index(
+            op.f("ix_user_api_keys_user_id"),
+            table_name="user_api_keys",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            op.f("ix_user_api_keys_user_id"),
+            "user_api_keys",
+            ["user_id"],
+            unique=False,
+        )
+        op.drop_index(
+            "uq_user_api_keys_user_model",
+            table_name="user_api_keys",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Replace ix_user_memories_user_id with a (user_id, created_at DESC) index
+
+Revision ID: f6b3d0e4a8c5
+Revises: e5a2c9d3f7b4
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
+
+revision = "f6b3d0e4a8c5"
+down_revision = "e5a2c9d3f7b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            "ix_user_memories_user_created",
+            "user_memories",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+        )
+        op.drop_index(
+            op.f("ix_user_memories_user_id"),
+            table_name="user_memories",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    with concurrent_index_block():
+        create_index_concurrently(
+            op.f("ix_user_memories_user_id"),
+            "user_memories",
+            ["user_id"],
+            unique=False,
+        )
+        op.drop_index(
+            "ix_user_memories_user_created",
+            table_name="user_memories",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -8,6 +8,7 @@ Create Date: 2024-10-16 13:00:00.000000
 
 from alembic import op
 import sqlalchemy as sa
+from app.core.migration_ops import concurrent_index_block, create_index_concurrently
 
 
 # revision identifiers, used by Alembic.
@@ -38,25 +39,6 @@ def upgrade():
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_chat_sessions_id"), "chat_sessions", ["id"], unique=False)
-    op.create_index(
-        op.f("ix_chat_sessions_title"), "chat_sessions", ["title"], unique=False
-    )
-    op.create_index(
-        op.f("ix_chat_sessions_user_id"), "chat_sessions", ["user_id"], unique=False
-    )
-    op.create_index(
-        op.f("ix_chat_sessions_created_at"),
-        "chat_sessions",
-        ["created_at"],
-        unique=False,
-    )
-    op.create_index(
-        op.f("ix_chat_sessions_updated_at"),
-        "chat_sessions",
-        ["updated_at"],
-        unique=False,
-    )
     op.alter_column(
         "chat_sessions",
         "updated_at",
@@ -65,12 +47,26 @@ def upgrade():
         server_default=sa.text("now()"),
     )
 
+    # Build the index outside the migration transaction so PostgreSQL does not
+    # hold an ACCESS EXCLUSIVE lock on chat_sessions for the whole build.
+    # Sessions are listed per user ordered by created_at, which this one
+    # composite index serves without a sort; id is covered by the primary key.
+    with concurrent_index_block():
+        create_index_concurrently(
+            "ix_chat_sessions_user_created",
+            "chat_sessions",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+        )
+
 
 def downgrade():
+    with concurrent_index_block():
+        op.drop_index(
+            "ix_chat_sessions_user_created",
+            table_name="chat_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
     # Drop chat_sessions table
-    op.drop_index(op.f("ix_chat_sessions_updated_at"), table_name="chat_sessions")
-    op.drop_index(op.f("ix_chat_sessions_created_at"), table_name="chat_sessions")
-    op.drop_index(op.f("ix_chat_sessions_user_id"), table_name="chat_sessions")
-    op.drop_index(op.f("ix_chat_sessions_title"), table_name="chat_sessions")
-    op.drop_index(op.f("ix_chat_sessions_id"), table_name="chat_sessions")
     op.drop_table("chat_sessions")
@@ -1,65 +1,129 @@
+import hashlib
 import time
-from datetime import UTC
+from datetime import UTC, datetime
+from typing import NamedTuple
 from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.crud.user import user
-from app.core.security import verify_token, get_token_issued_at
+from app.core.security import claim_datetime, verify_token_claims
 from app.models.user import User
 
+
+class CachedUser(NamedTuple):
+    """Read-only view of a ``User`` row served from the in-process cache.
+
+    Endpoints that need to write to the user must load the ORM entity via
+    ``get_current_db_user``.
+    """
+
+    id: int
+    email: str
+    is_active: bool
+    messages_used: int
+    custom_instructions: str | None
+    created_at: datetime | None
+    last_logout_all_at: datetime | None
+
+
 _USER_CACHE_TTL = 600
-_user_cache: dict[str, tuple[float, dict]] = {}
+_user_cache: dict[str, tuple[float, CachedUser]] = {}
 
+# Short-lived token -> claims cache so the blacklist lookup in
+# ``verify_token_claims`` runs at most once per token per TTL window.
+_TOKEN_CACHE_TTL = 30
+_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: dict[str, tuple[float, dict]] = {}
 
-def _get_cached_user(user_id: int) -> User | None:
-    entry = _user_cache.get(f"user:{user_id}")
+
+def _user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def _get_cached_user(user_id: int) -> CachedUser | None:
+    # The cache lives in-process and stores immutable CachedUser tuples, so
+    # a hit costs one dict lookup and no ORM instantiation.
+    key = _user_cache_key(user_id)
+    entry = _user_cache.get(key)
     if entry is None:
         return None
-    cached_at, user_dict = entry
-    if time.time() - cached_at > _USER_CACHE_TTL:
-        del _user_cache[f"user:{user_id}"]
+    cached_at, cached_user = entry
+    if time.monotonic() - cached_at > _USER_CACHE_TTL:
+        _user_cache.pop(key, None)
         return None
-    return _user_from_dict(user_dict)
+    return cached_user
 
 
-def _set_cached_user(user_obj: User) -> None:
-    _user_cache[f"user:{user_obj.id}"] = (
-        time.time(),
-        _user_to_dict(user_obj),
+def cache_user(user_obj: User) -> None:
+    """Store ``user_obj`` so the next ``get_current_user`` skips the DB."""
+    # Monotonic, like the models cache: a wall-clock step can't stretch or
+    # cut short the TTL
+    _user_cache[_user_cache_key(user_obj.id)] = (
+        time.monotonic(),
+        _user_to_cached(user_obj),
     )
 
 
-def _user_to_dict(user_obj: User) -> dict:
-    return {
-        "id": user_obj.id,
-        "email": user_obj.email,
-        "hashed_password": user_obj.hashed_password,
-        "is_active": user_obj.is_active,
-        "messages_used": user_obj.messages_used,
-        "custom_instructions": user_obj.custom_instructions,
-        "last_logout_all_at": user_obj.last_logout_all_at,
-    }
-
-
-def _user_from_dict(d: dict) -> User:
-    user_obj = User(
-        id=d["id"],
-        email=d["email"],
-        hashed_password=d["hashed_password"],
+def _user_to_cached(user_obj: User) -> CachedUser:
+    return CachedUser(
+        id=user_obj.id,
+        email=user_obj.email,
+        is_active=user_obj.is_active,
+        messages_used=user_obj.messages_used,
+        custom_instructions=user_obj.custom_instructions,
+        created_at=user_obj.created_at,
+        last_logout_all_at=user_obj.last_logout_all_at,
     )
-    user_obj.is_active = d.get("is_active", True)
-    user_obj.messages_used = d.get("messages_used", 0)
-    user_obj.custom_instructions = d.get("custom_instructions")
-    user_obj.last_logout_all_at = d.get("last_logout_all_at")
-    return user_obj
 
 
 def invalidate_user_cache(user_id: int) -> None:
-    _user_cache.pop(f"user:{user_id}", None)
+    _user_cache.pop(_user_cache_key(user_id), None)
 
 
 def clear_user_cache() -> None:
     _user_cache.clear()
+    _token_cache.clear()
+
+
+def _token_cache_key(token: str) -> str:
+    return f"tok:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def _prune_token_cache(now: float) -> None:
+    expired = [k for k, (expires_at, _) in _token_cache.items() if expires_at <= now]
+    for k in expired:
+        del _token_cache[k]
+    if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.clear()
+
+
+def _verify_token_cached(token: str, db: Session) -> dict | None:
+    """Return the token's verified claims, consulting the blacklist at most
+    once per ``_TOKEN_CACHE_TTL`` seconds (or the token's remaining lifetime)."""
+    key = _token_cache_key(token)
+    now = time.time()
+    entry = _token_cache.get(key)
+    if entry is not None:
+        expires_at, claims = entry
+        if now < expires_at:
+            return claims
+        _token_cache.pop(key, None)
+
+    claims = verify_token_claims(token, db)
+    if not claims:
+        return None
+
+    exp = claims.get("exp")
+    ttl = _TOKEN_CACHE_TTL if exp is None else min(_TOKEN_CACHE_TTL, exp - now)
+    if ttl > 0:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+            _prune_token_cache(now)
+        _token_cache[key] = (now + ttl, claims)
+    return claims
+
+
+def invalidate_token_cache(token: str) -> None:
+    _token_cache.pop(_token_cache_key(token), None)
 
 
 def get_token_from_cookie(request: Request) -> str:
@@ -73,23 +137,27 @@ def get_token_from_cookie(request: Request) -> str:
     return token
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(get_token_from_cookie)
-) -> User:
-    user_id = verify_token(token, db)
-    if not user_id:
+def _authenticate(request: Request, db: Session) -> tuple[CachedUser | User, dict]:
+    """Resolve the request's cookie to ``(user, claims)`` in a single pass.
+
+    The token is decoded once; its claims drive both the user lookup and the
+    logout-all revocation check.
+    """
+    token = get_token_from_cookie(request)
+    claims = _verify_token_cached(token, db)
+    if not claims:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token or token has been revoked",
         )
 
-    parsed_user_id = int(user_id)
+    parsed_user_id = int(claims["sub"])
 
     # 1. Check cache first — avoids DB query if user is recently cached
     cached = _get_cached_user(parsed_user_id)
     if cached is not None:
-        _check_token_not_revoked(cached, token)
-        return cached
+        _check_token_not_revoked(cached, claims)
+        return cached, claims
 
     # 2. Fetch from DB
     user_obj = user.get(db, id=parsed_user_id)
@@ -99,19 +167,32 @@ def get_current_user(
         )
 
     # 3. Check logout-all revocation against fresh DB record
-    _check_token_not_revoked(user_obj, token)
+    _check_token_not_revoked(user_obj, claims)
 
     # 4. Cache and return
-    _set_cached_user(user_obj)
-    return user_obj
+    cache_user(user_obj)
+    return user_obj, claims
+
 
+def get_auth_context(
+    request: Request, db: Session = Depends(get_db)
+) -> tuple[CachedUser | User, dict]:
+    """Dependency for endpoints that need the token claims as well as the user."""
+    return _authenticate(request, db)
 
-def _check_token_not_revoked(user_obj: User, token: str) -> None:
+
+def get_current_user(
+    request: Request, db: Session = Depends(get_db)
+) -> CachedUser | User:
+    return _authenticate(request, db)[0]
+
+
+def _check_token_not_revoked(user_obj: CachedUser | User, claims: dict) -> None:
     """If the user performed a bulk logout-all, reject any token
     issued before that timestamp."""
     if not user_obj.last_logout_all_at:
         return
-    token_iat = get_token_issued_at(token)
+    token_iat = claim_datetime(claims, "iat")
     if token_iat and token_iat < user_obj.last_logout_all_at.replace(tzinfo=UTC):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,7 +200,24 @@ def _check_token_not_revoked(user_obj: User, token: str) -> None:
         )
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(
+    current_user: CachedUser | User = Depends(get_current_user),
+) -> CachedUser | User:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+def get_current_db_user(
+    current_user: CachedUser | User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+) -> User:
+    """Load the current user as an ORM entity, for endpoints that modify it."""
+    if isinstance(current_user, User):
+        return current_user
+    db_user = user.get(db, id=current_user.id)
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    return db_user
@@ -5,19 +5,34 @@ from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 from app import crud
 from app.schemas.user import User, UserCreate
-from app.api.deps import get_db
-from app.core.security import create_access_token
-
-from app.utils.cookies import set_auth_cookie
+from app.api.deps import (
+    cache_user,
+    get_auth_context,
+    get_db,
+    invalidate_token_cache,
+    invalidate_user_cache,
+)
+from app.core.security import (
+    blacklist_filter,
+    blacklist_token,
+    claim_datetime,
+    create_access_token,
+    decode_token_claims,
+)
+from app.crud.token_blacklist import token_blacklist_crud
+
+from app.utils.cookies import clear_auth_cookie, set_auth_cookie
 from app.core.config import settings
 
 limiter = Limiter(key_func=get_remote_address)
 
+_AUTH_RATE_LIMIT = "50/minute" if settings.ENVIRONMENT == "testing" else "5/minute"
+
 router = APIRouter()
 
 
 @router.post("/register", response_model=User)
-@limiter.limit("50/minute" if settings.ENVIRONMENT == "testing" else "5/minute")
+@limiter.limit(_AUTH_RATE_LIMIT)
 def register(request: Request, user_in: UserCreate, db: Session = Depends(get_db)):
     db_user = crud.user.get_by_email(db, email=user_in.email)
     if db_user:
@@ -26,7 +41,7 @@ def register(request: Request, user_in: UserCreate, db: Session = Depends(get_db
 
 
 @router.post("/login")
-@limiter.limit("50/minute" if settings.ENVIRONMENT == "testing" else "5/minute")
+@limiter.limit(_AUTH_RATE_LIMIT)
 def login(
     request: Request,
     response: Response,
@@ -42,6 +57,9 @@ def login(
     access_token, token_jti = create_access_token(data={"sub": str(user.id)})
 
     set_auth_cookie(response, access_token)
+    # The client's next request will authenticate as this user; we already
+    # have the fresh row in hand.
+    cache_user(user)
 
     return {
         "success": True,
@@ -54,19 +72,15 @@ def login(
 @router.post("/logout")
 def logout(response: Response, request: Request, db: Session = Depends(get_db)):
     """Logout user and blacklist current token."""
-    from app.utils.cookies import clear_auth_cookie
-    from app.core.security import extract_token_jti, get_token_expires_at
-
     token = request.cookies.get("access_token")
 
     if token:
-        token_jti = extract_token_jti(token)
-        expires_at = get_token_expires_at(token)
+        claims = decode_token_claims(token)
+        token_jti = claims.get("jti")
+        expires_at = claim_datetime(claims, "exp")
 
         if token_jti:
-            from app.crud.token_blacklist import token_blacklist_crud
-
-            token_blacklist_crud.create_blacklist_entry(
+            blacklist_token(
                 db=db,
                 token_jti=token_jti,
                 user_id=None,
@@ -75,6 +89,7 @@ def logout(response: Response, request: Request, db: Session = Depends(get_db)):
                 reason="logout",
                 expires_at=expires_at,
             )
+        invalidate_token_cache(token)
 
     clear_auth_cookie(response)
     return {"success": True, "message": "Successfully logged out"}
@@ -82,7 +97,10 @@ def logout(response: Response, request: Request, db: Session = Depends(get_db)):
 
 @router.post("/logout-all")
 def logout_all_sessions(
-    response: Response, request: Request, db: Session = Depends(get_db)
+    response: Response,
+    request: Request,
+    db: Session = Depends(get_db),
+    auth_context: tuple = Depends(get_auth_context),
 ):
     """Logout user from all sessions by invalidating all tokens.
 
@@ -90,29 +108,18 @@ def logout_all_sessions(
     with an `iat` before this timestamp will be rejected on next use.
     The current session's JTI is also blacklisted for immediate effect.
     """
-    from app.utils.cookies import clear_auth_cookie
-    from app.core.security import verify_token, extract_token_jti, get_token_expires_at
-
-    token = request.cookies.get("access_token")
-    if not token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    user_id = verify_token(token, db)
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    from app.crud.token_blacklist import token_blacklist_crud
-
-    current_jti = extract_token_jti(token)
-    current_exp = get_token_expires_at(token)
+    current_user, claims = auth_context
 
     blacklisted_count = token_blacklist_crud.blacklist_user_tokens(
         db=db,
-        user_id=int(user_id),
-        current_token_jti=current_jti,
-        current_token_expires_at=current_exp,
+        user_id=current_user.id,
+        current_token_jti=claims["jti"],
+        current_token_expires_at=claim_datetime(claims, "exp"),
         reason="logout_all_sessions",
     )
+    blacklist_filter.add(claims["jti"])
+    invalidate_token_cache(request.cookies["access_token"])
+    invalidate_user_cache(current_user.id)
 
     clear_auth_cookie(response)
     return {
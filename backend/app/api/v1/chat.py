@@ -1,14 +1,26 @@
 import asyncio
-import json
 import logging
 import os
+import shutil
+import zlib
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Optional
+from datetime import datetime
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # optional: SSE streams fall back to gzip
+    zstandard = None
 
 from app import crud
 from app.api.deps import get_current_active_user, get_db
+from app.core.config import settings
 from app.core.input_validation import InputSanitizer
 from app.crud.document import document as document_crud
+from app.models.message import Message as MessageModel
 from app.models.user import User
 from app.schemas.document import Document as DocumentSchema
 from app.schemas.message import Message, MessageCreate, MessagePagination
@@ -22,7 +34,12 @@ from app.services.ai_chat import ai_service
 from app.services.llm_service import llm_service
 from app.services.document_task_service import process_document_task
 from app.services.session_service import session_service
-from app.utils.pagination import compute_pagination_meta
+from app.utils.etag import etag_response, file_etag_response
+from app.utils.pagination import (
+    compute_cursor_meta,
+    compute_pagination_meta,
+    decode_cursor,
+)
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -30,11 +47,12 @@ from fastapi import (
     File,
     HTTPException,
     Query,
+    Request,
     UploadFile,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from starlette.responses import FileResponse
 
 logger = logging.getLogger(__name__)
 
@@ -42,18 +60,153 @@ router = APIRouter()
 
 
 def _validate_session_ownership(db: Session, session_id: int, user_id: int) -> None:
-    session_obj = crud.session.get(db, id=session_id)
+    session_obj = crud.session.get_summary(db, id=session_id)
     if not session_obj or session_obj.user_id != user_id:
         raise HTTPException(status_code=404, detail="Session not found")
 
 
+def _parse_cursor(cursor: Optional[str]) -> Tuple[Optional[datetime], Optional[int]]:
+    if not cursor:
+        return None, None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+# Fields the Message schema needs to validate, kept even when not requested
+_MANDATORY_MESSAGE_FIELDS = ("id", "content", "response", "model", "user_id", "created_at")
+
+
+def _selected_message_fields(fields: str) -> Tuple[str, ...]:
+    """Resolve a ``fields`` query string to Message schema fields.
+
+    Names that are not both schema fields and model attributes are dropped,
+    and the mandatory fields are always added. The mandatory fields keep the
+    tuple at two or more entries, so an ``attrgetter`` over it always
+    returns a tuple.
+    """
+    selected = [f.strip() for f in fields.split(",")]
+    selected.extend(_MANDATORY_MESSAGE_FIELDS)
+    return tuple(
+        field
+        for field in dict.fromkeys(selected)
+        if field in Message.model_fields and hasattr(MessageModel, field)
+    )
+
+
 # ---------------------------------------------------------------------------
 # Shared SSE helpers
 # ---------------------------------------------------------------------------
-def _format_sse_data(chunk: str) -> str:
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_DONE = b"data: [DONE]\n\n"
+
+
+def _sse_event(payload: Any) -> bytes:
+    """Serialize a JSON SSE event straight to bytes.
+
+    orjson escapes newlines inside strings, so the event is always a single
+    ``data:`` line and needs no splitting.
+    """
+    return _SSE_PREFIX + orjson.dumps(payload) + _SSE_SUFFIX
+
+
+def _format_sse_data(chunk: str) -> bytes:
     """Format data as a Server-Sent Event line."""
+    if "\n" not in chunk:
+        return _SSE_PREFIX + chunk.encode() + _SSE_SUFFIX
     lines = chunk.split("\n")
-    return "".join(f"data: {line}\n" for line in lines) + "\n"
+    return ("".join(f"data: {line}\n" for line in lines) + "\n").encode()
+
+
+_SSE_HEADERS = {
+    # no-transform stops proxies from re-encoding (and buffering) the stream
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "Access-Control-Allow-Headers": "Cache-Control",
+    "X-Accel-Buffering": "no",
+}
+
+
+async def _gzip_stream(
+    chunks: AsyncGenerator[bytes, None],
+) -> AsyncGenerator[bytes, None]:
+    """Gzip an event stream with a single deflate context.
+
+    Each chunk is followed by a ``Z_SYNC_FLUSH`` so the client can decode
+    it immediately, while the compressor keeps its window across chunks.
+    """
+    compressor = zlib.compressobj(
+        settings.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+    )
+    try:
+        async for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+        yield compressor.flush(zlib.Z_FINISH)
+    finally:
+        await chunks.aclose()
+
+
+async def _zstd_stream(
+    chunks: AsyncGenerator[bytes, None],
+) -> AsyncGenerator[bytes, None]:
+    """Zstd-compress an event stream as one frame, flushing a block per chunk.
+
+    The zstd counterpart of ``_gzip_stream``: ``COMPRESSOBJ_FLUSH_BLOCK``
+    plays the role of ``Z_SYNC_FLUSH``.
+    """
+    compressor = zstandard.ZstdCompressor(level=settings.ZSTD_LEVEL).compressobj()
+    try:
+        async for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(
+                zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            )
+        yield compressor.flush()
+    finally:
+        await chunks.aclose()
+
+
+def _accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows ``coding``.
+
+    Honours q-values, so ``gzip;q=0`` is a refusal, and falls back to a
+    ``*`` entry when the coding itself is not listed.
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        qualities[name.strip()] = q
+    return qualities.get(coding, qualities.get("*", 0.0)) > 0
+
+
+def _sse_response(
+    request: Request, chunks: AsyncGenerator[bytes, None]
+) -> StreamingResponse:
+    """Wrap an SSE generator, compressing it when the client allows.
+
+    zstd is preferred when the library is installed and the client accepts
+    it, as it encodes faster than gzip at a similar ratio.
+    """
+    headers = dict(_SSE_HEADERS)
+    headers["Vary"] = "Accept-Encoding"
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if zstandard is not None and _accepts_encoding(accept_encoding, "zstd"):
+        headers["Content-Encoding"] = "zstd"
+        chunks = _zstd_stream(chunks)
+    elif _accepts_encoding(accept_encoding, "gzip"):
+        headers["Content-Encoding"] = "gzip"
+        chunks = _gzip_stream(chunks)
+    return StreamingResponse(chunks, media_type="text/event-stream", headers=headers)
 
 
 def _extract_ui_marker(chunk: str) -> Optional[Dict[str, Any]]:
@@ -69,8 +222,8 @@ def _extract_ui_marker(chunk: str) -> Optional[Dict[str, Any]]:
 
     ui_json_str = chunk[len(marker_start) : end_idx]
     try:
-        ui_data = json.loads(ui_json_str)
-    except json.JSONDecodeError:
+        ui_data = orjson.loads(ui_json_str)
+    except orjson.JSONDecodeError:
         logger.warning("Generated UI marker contained invalid JSON")
         return None
 
@@ -81,49 +234,61 @@ def _extract_ui_marker(chunk: str) -> Optional[Dict[str, Any]]:
     return ui_data
 
 
+_MAX_TITLE_LEN = 60
+
+# Upper bound on models queried at once by /chat/models/test
+_MODEL_TEST_CONCURRENCY = 4
+
+
+def _truncate_title(user_message: str) -> str:
+    if len(user_message) > _MAX_TITLE_LEN:
+        return user_message[:_MAX_TITLE_LEN] + "..."
+    return user_message
+
+
 def _update_session_title_if_needed(
     db: Session,
-    session_id: int,
+    session_id: Optional[int],
+    user_id: int,
     user_message: str,
-    max_title_len: int = 60,
 ) -> None:
     """Update a 'New Chat' session title to the first user message."""
     if not session_id:
         return
-    session_obj = crud.session.get(db, id=session_id)
-    if session_obj and (
-        session_obj.title == "New Chat"
-        or not session_obj.title
-        or session_obj.title.strip() == ""
-    ):
-        new_title = user_message[:max_title_len]
-        if len(user_message) > max_title_len:
-            new_title += "..."
-        crud.session.update(
-            db, db_obj=session_obj, obj_in=ChatSessionUpdate(title=new_title)
-        )
+    crud.session.update_title_if_default(
+        db,
+        id=session_id,
+        user_id=user_id,
+        title=_truncate_title(user_message),
+    )
 
 
-async def _extract_memories_events(
-    message: str,
-    user_id: int,
-    model: str,
-    db: Optional[Session] = None,
-) -> AsyncGenerator[str, None]:
-    """Extract memories and yield SSE-formatted events."""
+async def _extract_memories(message: str, user_id: int, model: str) -> List[str]:
+    """Extract and save memories from a user message, logging any failure.
+
+    Opens its own DB session so it can run alongside the request's work,
+    either as a background task or next to a streaming reply.
+    """
     try:
         logger.info(f"[MEMORY] Starting memory extraction for user {user_id}...")
         saved_facts = await ai_service.extract_and_save_memories(
-            message, user_id, model, db=db
+            message, user_id, model
         )
         logger.info(f"[MEMORY] Extraction complete: {len(saved_facts)} facts saved")
-        for fact in saved_facts:
-            event = json.dumps({"type": "memory_saved", "content": fact})
-            yield _format_sse_data(event)
+        return saved_facts
     except Exception as e:
         logger.error(f"[MEMORY] Failed to process memories: {e}")
         import traceback
         logger.error(f"[MEMORY] Traceback:\n{traceback.format_exc()}")
+        return []
+
+
+async def _memory_events(
+    extraction: "asyncio.Task[List[str]]",
+) -> AsyncGenerator[bytes, None]:
+    """Yield SSE events for the facts saved by a running extraction."""
+    for fact in await extraction:
+        yield _sse_event({"type": "memory_saved", "content": fact})
 
 
 # Session Management Endpoints
@@ -144,6 +309,7 @@ def create_session(
 
 @router.get("/sessions", response_model=ChatSessionPagination)
 def get_user_sessions(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -154,31 +320,42 @@ def get_user_sessions(
     search: str = Query(
         None, description="Search term to filter sessions by title or description"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor; when set, skip is ignored"
+    ),
 ):
     """
     Get all chat sessions for the current user with message counts.
     """
-    sessions = session_service.get_user_sessions(
-        db,
-        current_user,
-        skip=skip,
-        limit=limit,
-        newest_first=newest_first,
-        search=search,
-    )
+    if cursor:
+        after_created_at, after_id = _parse_cursor(cursor)
+        sessions = session_service.get_user_sessions(
+            db,
+            current_user,
+            limit=limit + 1,
+            newest_first=newest_first,
+            search=search,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+        sessions, meta = compute_cursor_meta(sessions, limit)
+    else:
+        sessions, total_count = session_service.get_user_sessions_page(
+            db,
+            current_user,
+            skip=skip,
+            limit=limit,
+            newest_first=newest_first,
+            search=search,
+        )
+        meta = compute_pagination_meta(skip, limit, total_count, rows=sessions)
 
-    total_count = crud.session.count_by_user(
-        db, user_id=current_user.id, search=search
-    )
-
-    return ChatSessionPagination(
-        data=sessions,
-        meta=compute_pagination_meta(skip, limit, total_count),
-    )
+    return etag_response(request, ChatSessionPagination(data=sessions, meta=meta))
 
 
 @router.get("/sessions/{session_id}", response_model=ChatSession)
 def get_session(
+    request: Request,
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -189,7 +366,7 @@ def get_session(
     session_data = session_service.get_session_by_id(db, session_id, current_user)
     if not session_data:
         raise HTTPException(status_code=404, detail="Session not found")
-    return ChatSession(**session_data)
+    return etag_response(request, ChatSession(**session_data))
 
 
 @router.put("/sessions/{session_id}", response_model=ChatSession)
@@ -235,27 +412,35 @@ def get_session_messages(
     newest_first: bool = Query(
         True, description="Order by newest first (true) or oldest first (false)"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor; when set, skip is ignored"
+    ),
 ):
     """
     Get messages for a specific session.
     """
-    # Check if session exists and belongs to user
-    session_data = session_service.get_session_by_id(db, session_id, current_user)
-    if not session_data:
-        raise HTTPException(status_code=404, detail="Session not found")
+    after_created_at, after_id = _parse_cursor(cursor)
 
-    messages = session_service.get_session_messages(
-        db, session_id, current_user, skip=skip, limit=limit, newest_first=newest_first
+    # Ownership is enforced by the page query itself
+    messages, total = session_service.get_session_messages_page(
+        db,
+        session_id,
+        current_user,
+        skip=skip,
+        limit=limit + 1 if cursor else limit,
+        newest_first=newest_first,
+        after_created_at=after_created_at,
+        after_id=after_id,
     )
+    if messages is None:
+        raise HTTPException(status_code=404, detail="Session not found")
 
-    total_count = crud.message.count_by_user(
-        db, user_id=current_user.id, session_id=session_id
-    )
+    if cursor:
+        messages, meta = compute_cursor_meta(messages, limit)
+    else:
+        meta = compute_pagination_meta(skip, limit, total, rows=messages)
 
-    return MessagePagination(
-        data=messages,
-        meta=compute_pagination_meta(skip, limit, total_count),
-    )
+    return MessagePagination(data=messages, meta=meta)
 
 
 @router.delete("/sessions/{session_id}/messages")
@@ -302,7 +487,7 @@ async def chat(
     if session_id is not None:
         _validate_session_ownership(db, session_id, current_user.id)
 
-    response = ""
+    response_parts = []
     ui_data = None
     async for chunk in ai_service.simple_chat(
         message_in.content,
@@ -318,32 +503,30 @@ async def chat(
         if extracted_ui is not None:
             ui_data = extracted_ui
             continue
-        response += chunk
+        response_parts.append(chunk)
     msg = crud.message.create(
         db,
         obj_in=message_in,
-        response=response,
+        response="".join(response_parts),
         user_id=current_user.id,
         session_id=session_id,
+        ui_data=ui_data,
     )
-    if ui_data is not None:
-        msg = crud.message.update(db, db_obj=msg, obj_in={"ui_data": ui_data})
-
-    # Update session title from 'New Chat' to the first message if needed
-    _update_session_title_if_needed(db, session_id, message_in.content)
 
-    # Extract memories from the user message
-    saved_memories = []
-    try:
-        saved_memories = await ai_service.extract_and_save_memories(
-            message_in.content,
-            current_user.id,
-            message_in.model,
-        )
-    except Exception as e:
-        logger.error(f"Failed to extract memories in chat: {e}")
+    # Update session title from 'New Chat' to the first message if needed.
+    # Nothing in the response depends on it, so it runs after the reply is sent.
+    background_tasks.add_task(
+        _update_session_title_if_needed,
+        db,
+        session_id,
+        current_user.id,
+        message_in.content,
+    )
 
-    msg.saved_memories = saved_memories
+    # Memory extraction is another LLM call; keep it off the reply's path
+    background_tasks.add_task(
+        _extract_memories, message_in.content, current_user.id, message_in.model
+    )
     return msg
 
 
@@ -375,26 +558,26 @@ async def chat_with_tools(
         session_id=session_id,
     )
 
-    # Update session title from 'New Chat' to the first message if needed
-    _update_session_title_if_needed(db, session_id, message_in.content)
-
-    # Extract memories from the user message
-    saved_memories = []
-    try:
-        saved_memories = await ai_service.extract_and_save_memories(
-            message_in.content,
-            current_user.id,
-            message_in.model,
-        )
-    except Exception as e:
-        logger.error(f"Failed to extract memories in chat-with-tools: {e}")
+    # Update session title from 'New Chat' to the first message if needed.
+    # Nothing in the response depends on it, so it runs after the reply is sent.
+    background_tasks.add_task(
+        _update_session_title_if_needed,
+        db,
+        session_id,
+        current_user.id,
+        message_in.content,
+    )
 
-    msg.saved_memories = saved_memories
+    # Memory extraction is another LLM call; keep it off the reply's path
+    background_tasks.add_task(
+        _extract_memories, message_in.content, current_user.id, message_in.model
+    )
     return msg
 
 
 @router.post("/chat/stream")
 async def chat_stream(
+    request: Request,
     message_in: MessageCreate,
     session_id: Optional[int] = Query(
         None, description="Session ID for conversation context"
@@ -414,7 +597,8 @@ async def chat_stream(
 
         stream_db = SessionLocal()
         msg = None
-        full_response = ""
+        memories = None
+        response_parts = []
         try:
             msg = crud.message.create(
                 stream_db,
@@ -423,12 +607,19 @@ async def chat_stream(
                 user_id=current_user.id,
                 session_id=session_id,
             )
-            yield _format_sse_data(
-                json.dumps({"type": "metadata", "message_id": msg.id})
+            yield _sse_event({"type": "metadata", "message_id": msg.id})
+            # Memory extraction only needs the user message, so it runs while
+            # the reply streams instead of after it
+            memories = asyncio.create_task(
+                _extract_memories(
+                    message_in.content, current_user.id, message_in.model
+                )
             )
             logger.info(f"[STREAM] Created message {msg.id}, starting simple_chat (search_web={message_in.search_web}, model={message_in.model})")
 
-            _update_session_title_if_needed(stream_db, session_id, message_in.content)
+            _update_session_title_if_needed(
+                stream_db, session_id, current_user.id, message_in.content
+            )
 
             ui_data = None
             content_chunks = 0
@@ -446,18 +637,15 @@ async def chat_stream(
                 ui_data_from_marker = _extract_ui_marker(chunk)
                 if ui_data_from_marker is not None:
                     ui_data = ui_data_from_marker
-                    yield _format_sse_data(
-                        json.dumps({"type": "ui", "data": ui_data})
-                    )
+                    yield _sse_event({"type": "ui", "data": ui_data})
                     logger.info(f"[STREAM] UI data yielded for message {msg.id}")
                     continue
-                full_response += chunk
+                response_parts.append(chunk)
                 content_chunks += 1
                 # Wrap in JSON so multiline content doesn't break SSE boundaries
-                yield _format_sse_data(
-                    json.dumps({"type": "content", "content": chunk})
-                )
+                yield _sse_event({"type": "content", "content": chunk})
 
+            full_response = "".join(response_parts)
             _t_stream_end = asyncio.get_running_loop().time()
             logger.info(f"[STREAM] simple_chat completed: total_chunks={content_chunks}, response_len={len(full_response)}, stream_duration={_t_stream_end-_t_stream_start:.3f}s for message {msg.id}")
 
@@ -470,25 +658,25 @@ async def chat_stream(
 
             # Yield memory events
             _t_mem_start = asyncio.get_running_loop().time()
-            logger.info(f"[STREAM] Extracting memories for message {msg.id}...")
-            async for mem_event in _extract_memories_events(
-                message_in.content, current_user.id, message_in.model, stream_db
-            ):
+            logger.info(f"[STREAM] Waiting on memories for message {msg.id}...")
+            async for mem_event in _memory_events(memories):
                 yield mem_event
             _t_mem_end = asyncio.get_running_loop().time()
             logger.info(f"[STREAM] Memories done ({_t_mem_end-_t_mem_start:.3f}s), yielding [DONE] for message {msg.id}")
 
-            yield "data: [DONE]\n\n"
+            yield _SSE_DONE
             logger.info(f"[STREAM] [DONE] yielded for message {msg.id}")
 
         except Exception as e:
             logger.error(f"[STREAM] Streaming error: {e}")
             import traceback
             logger.error(f"[STREAM] Traceback:\n{traceback.format_exc()}")
-            yield f"data: ERROR: {str(e)}\n\n"
+            yield _format_sse_data(f"ERROR: {str(e)}")
         finally:
+            if memories is not None and not memories.done():
+                memories.cancel()
             try:
-                if msg and not full_response.strip():
+                if msg and not any(part.strip() for part in response_parts):
                     crud.message.remove(stream_db, id=msg.id)
                     logger.info(f"[STREAM] Cleaned up empty/failed message record {msg.id}")
             except Exception as cleanup_err:
@@ -496,19 +684,12 @@ async def chat_stream(
             finally:
                 stream_db.close()
 
-    return StreamingResponse(
-        stream_response(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Headers": "Cache-Control",
-        },
-    )
+    return _sse_response(request, stream_response())
 
 
 @router.post("/chat/agent-stream")
 async def chat_agent_stream(
+    request: Request,
     message_in: MessageCreate,
     session_id: Optional[int] = Query(
         None, description="Session ID for conversation context"
@@ -528,7 +709,8 @@ async def chat_agent_stream(
 
         stream_db = SessionLocal()
         msg = None
-        full_response = ""
+        memories = None
+        response_parts = []
         try:
             msg = crud.message.create(
                 stream_db,
@@ -537,45 +719,48 @@ async def chat_agent_stream(
                 user_id=current_user.id,
                 session_id=session_id,
             )
-            yield _format_sse_data(
-                json.dumps({"type": "metadata", "message_id": msg.id})
+            yield _sse_event({"type": "metadata", "message_id": msg.id})
+            memories = asyncio.create_task(
+                _extract_memories(
+                    message_in.content, current_user.id, message_in.model
+                )
             )
 
-            _update_session_title_if_needed(stream_db, session_id, message_in.content)
+            _update_session_title_if_needed(
+                stream_db, session_id, current_user.id, message_in.content
+            )
 
-            async for chunk in ai_service.agent_chat_stream(
+            async for event in ai_service.agent_chat_stream(
                 message_in.content,
                 message_in.model,
                 current_user.id,
                 stream_db,
                 session_id,
             ):
-                yield _format_sse_data(chunk)
-
-                try:
-                    data = json.loads(chunk)
-                    if data.get("type") == "content":
-                        full_response += data.get("content", "")
-                except (json.JSONDecodeError, Exception):
-                    pass
+                yield _sse_event(event)
+                if event.get("type") == "content":
+                    response_parts.append(event.get("content", ""))
 
             if msg:
-                crud.message.update(stream_db, db_obj=msg, obj_in={"response": full_response})
+                crud.message.update(
+                    stream_db,
+                    db_obj=msg,
+                    obj_in={"response": "".join(response_parts)},
+                )
 
-            async for mem_event in _extract_memories_events(
-                message_in.content, current_user.id, message_in.model, stream_db
-            ):
+            async for mem_event in _memory_events(memories):
                 yield mem_event
 
-            yield "data: [DONE]\n\n"
+            yield _SSE_DONE
 
         except Exception as e:
             logging.error(f"Agent streaming error: {e}")
-            error_event = json.dumps({"type": "error", "content": str(e)})
-            yield f"data: {error_event}\n\n"
+            yield _sse_event({"type": "error", "content": str(e)})
         finally:
+            if memories is not None and not memories.done():
+                memories.cancel()
             try:
-                if msg and not full_response.strip():
+                if msg and not any(part.strip() for part in response_parts):
                     crud.message.remove(stream_db, id=msg.id)
                     logging.info(
                         f"Cleaned up empty/failed agent message record {msg.id}"
@@ -587,19 +772,12 @@ async def chat_agent_stream(
             finally:
                 stream_db.close()
 
-    return StreamingResponse(
-        stream_response(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Headers": "Cache-Control",
-        },
-    )
+    return _sse_response(request, stream_response())
 
 
 @router.get("/chat/history", response_model=MessagePagination)
 def get_chat_history(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -615,58 +793,53 @@ def get_chat_history(
     session_id: Optional[int] = Query(
         None, description="Filter messages by session ID"
     ),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from meta.next_cursor; when set, skip is ignored"
+    ),
 ):
     """
     Get paginated chat history for the current user with metadata.
     Includes field filtering, search capabilities, and optional session filtering.
     """
-    # Get messages with specified parameters
-    messages = crud.message.get_by_user(
-        db,
-        user_id=current_user.id,
-        skip=skip,
-        limit=limit,
-        newest_first=newest_first,
-        search=search,
-        session_id=session_id,
-    )
-
-    # Get total count for pagination metadata
-    total_count = crud.message.count_by_user(
-        db, user_id=current_user.id, search=search, session_id=session_id
-    )
+    selected_fields = _selected_message_fields(fields) if fields else None
+    # Skip the documents query when the caller didn't ask for them
+    with_documents = selected_fields is None or "documents" in selected_fields
+
+    if cursor:
+        after_created_at, after_id = _parse_cursor(cursor)
+        messages = crud.message.get_by_user(
+            db,
+            user_id=current_user.id,
+            limit=limit + 1,
+            newest_first=newest_first,
+            search=search,
+            session_id=session_id,
+            after_created_at=after_created_at,
+            after_id=after_id,
+            with_documents=with_documents,
+        )
+        # The extra row tells us whether there is a next page; no COUNT(*)
+        messages, meta = compute_cursor_meta(messages, limit)
+    else:
+        # The page query also returns the total via COUNT(*) OVER ()
+        messages, total_count = crud.message.get_page_by_user(
+            db,
+            user_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            newest_first=newest_first,
+            search=search,
+            session_id=session_id,
+            with_documents=with_documents,
+        )
+        meta = compute_pagination_meta(skip, limit, total_count, rows=messages)
 
     # Apply field filtering if specified
-    if fields:
-        selected_fields = [f.strip() for f in fields.split(",")]
-        # Ensure mandatory fields for Message schema are always included
-        # to avoid validation errors, unless we switch to a different schema.
-        mandatory_fields = [
-            "id",
-            "content",
-            "response",
-            "model",
-            "user_id",
-            "created_at",
-        ]
-        for field in mandatory_fields:
-            if field not in selected_fields:
-                selected_fields.append(field)
-
-        filtered_messages = []
-        for msg in messages:
-            filtered_msg = {
-                field: getattr(msg, field)
-                for field in selected_fields
-                if hasattr(msg, field)
-            }
-            filtered_messages.append(filtered_msg)
-        messages = filtered_messages
-
-    return MessagePagination(
-        data=messages,
-        meta=compute_pagination_meta(skip, limit, total_count),
-    )
+    if selected_fields:
+        getter = attrgetter(*selected_fields)
+        messages = [dict(zip(selected_fields, getter(msg))) for msg in messages]
+
+    return etag_response(request, MessagePagination(data=messages, meta=meta))
 
 
 @router.delete("/chat/history")
@@ -699,21 +872,14 @@ def delete_chat_message(
     """
     Delete a specific chat message by ID for the current user.
     """
-    # Check if the message belongs to the current user
-    message = crud.message.get(db, id=message_id)
-    if not message:
-        from fastapi import HTTPException
-
-        raise HTTPException(status_code=404, detail="Message not found")
-
-    if message.user_id != current_user.id:
+    # Ownership is part of the DELETE; only a miss needs a second look
+    if not crud.message.remove_if_owner(db, id=message_id, user_id=current_user.id):
+        if crud.message.get_owner_id(db, id=message_id) is None:
+            raise HTTPException(status_code=404, detail="Message not found")
         raise HTTPException(
             status_code=403, detail="Not authorized to delete this message"
         )
 
-    # Delete the message
-    crud.message.remove(db, id=message_id)
-
     return {
         "message": "Message deleted successfully",
         "deleted_id": message_id,
@@ -733,23 +899,29 @@ async def test_ai_models(
     Helpful for comparing model outputs and performance.
     """
     available_models = llm_service.get_available_models(current_user.id, db)
-    results = {}
+    semaphore = asyncio.Semaphore(_MODEL_TEST_CONCURRENCY)
 
-    for model in available_models:
-        try:
-            # Consume the async generator to get the complete response
-            response = ""
-            async for chunk in ai_service.simple_chat(
-                test_input, model, current_user.id, db
-            ):
-                response += chunk
-            results[model] = {"response": response, "status": "success"}
-        except Exception as e:
-            results[model] = {"response": None, "error": str(e), "status": "error"}
+    async def run_one(model: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                # Consume the async generator to get the complete response
+                response_parts = [
+                    chunk
+                    async for chunk in ai_service.simple_chat(
+                        test_input, model, current_user.id, db
+                    )
+                ]
+                return {"response": "".join(response_parts), "status": "success"}
+            except Exception as e:
+                return {"response": None, "error": str(e), "status": "error"}
+
+    # Models are queried concurrently, so the wall time is the slowest model
+    # rather than the sum of all of them
+    outcomes = await asyncio.gather(*(run_one(m) for m in available_models))
 
     return {
         "input": test_input,
-        "results": results,
+        "results": dict(zip(available_models, outcomes)),
         "total_models": len(available_models),
     }
 
@@ -797,6 +969,7 @@ async def test_provider_key(
 
 @router.get("/chat/models", response_model=Dict[str, Any])
 def get_available_models(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(
         get_current_active_user
@@ -805,10 +978,34 @@ def get_available_models(
     """
     Get list of available AI models.
     """
-    return {
-        "models": llm_service.get_available_models(current_user.id, db),
-        "total": len(llm_service.get_available_models(current_user.id, db)),
-    }
+    models = llm_service.get_available_models(current_user.id, db)
+    return etag_response(request, {"models": models, "total": len(models)})
+
+
+_UPLOAD_CHUNK_SIZE = 1 << 20
+_UPLOAD_DIR = Path(__file__).resolve().parents[3] / "uploads"
+
+
+def _save_upload(file: UploadFile, path: Path) -> None:
+    """Copy an upload to disk 1 MiB at a time instead of reading it whole.
+
+    Starlette has already spooled large uploads to a temp file, so this
+    keeps memory flat; it runs in the threadpool to keep disk I/O off the
+    event loop. The bytes land in a ``.part`` file beside ``path`` and are
+    renamed into place only once fully written, so a failed upload never
+    leaves a torn file under the name the document row points at.
+    """
+    tmp_path = path.with_name(f".{path.name}.part")
+    file.file.seek(0)
+    try:
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(file.file, f, _UPLOAD_CHUNK_SIZE)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 @router.post("/chat/upload", response_model=DocumentSchema)
@@ -834,14 +1031,11 @@ async def upload_file(
     }
     doc_record = document_crud.create(db, obj_in=doc_in)
 
-    backend_dir = Path(__file__).resolve().parents[3]
-    upload_dir = backend_dir / "uploads"
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    _UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
     sanitized_filename = InputSanitizer.sanitize_filename(file.filename)
-    stored_path = upload_dir / f"{doc_record.id}_{sanitized_filename}"
-    with open(stored_path, "wb") as f:
-        f.write(await file.read())
+    stored_path = _UPLOAD_DIR / f"{doc_record.id}_{sanitized_filename}"
+    await run_in_threadpool(_save_upload, file, stored_path)
 
     doc_record.file_path = str(stored_path)
     db.add(doc_record)
@@ -864,6 +1058,7 @@ async def upload_file(
 @router.get("/chat/documents/{document_id}/preview")
 def preview_document(
     document_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -878,7 +1073,8 @@ def preview_document(
         raise HTTPException(status_code=404, detail="File not available for preview")
 
     filename = doc_record.filename or f"document_{doc_record.id}.pdf"
-    return FileResponse(
+    return file_etag_response(
+        request,
         doc_record.file_path,
         media_type="application/pdf",
         headers={"Content-Disposition": f'inline; filename="{filename}"'},
@@ -907,7 +1103,7 @@ def get_document_status(
 
 
 @router.post("/chat/transcribe")
-def transcribe_audio(
+async def transcribe_audio(
     audio: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -925,14 +1121,21 @@ def transcribe_audio(
                 status_code=413,
                 detail=f"Audio file too large. Maximum size is {MAX_AUDIO_SIZE // (1024 * 1024)}MB.",
             )
-        audio_content = audio.file.read()
+        # Read at most one byte past the limit so oversized bodies stay bounded
+        audio_content = await audio.read(MAX_AUDIO_SIZE + 1)
         if len(audio_content) > MAX_AUDIO_SIZE:
             raise HTTPException(
                 status_code=413,
                 detail=f"Audio file too large. Maximum size is {MAX_AUDIO_SIZE // (1024 * 1024)}MB.",
             )
-        transcription = ai_service.transcribe_audio(
-            audio_content, audio.filename or "audio.wav", user_id=current_user.id, db=db
+        api_key = await run_in_threadpool(
+            llm_service.get_provider_key, "Groq", current_user.id, db
+        )
+        # The key lookup is the only DB work; hand the connection back to the
+        # pool instead of holding it through the Groq round-trip
+        db.close()
+        transcription = await ai_service.transcribe_audio(
+            audio_content, api_key, audio.filename or "audio.wav"
         )
         return {"text": transcription}
     except HTTPException:
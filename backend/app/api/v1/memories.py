@@ -1,25 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import List, Any, Optional
 from app import schemas
 from app.api.deps import get_current_active_user, get_db
 from app.models.user import User
 from app.crud.memory import memory as memory_crud
+from app.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
 
 @router.get("/memories", response_model=List[schemas.Memory])
 def read_memories(
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the X-Next-Cursor header; when set, skip is ignored"
+    ),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve memories for the current user.
+    A full page sets X-Next-Cursor, which fetches the next page without OFFSET.
     """
-    return memory_crud.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
+    after_created_at = after_id = None
+    if cursor:
+        try:
+            after_created_at, after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    memories = memory_crud.get_by_user(
+        db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=limit,
+        after_created_at=after_created_at,
+        after_id=after_id,
+    )
+    if memories and len(memories) == limit:
+        last = memories[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    return memories
 
 
 @router.post("/memories", response_model=schemas.Memory)
@@ -30,8 +30,7 @@ def create_search_history_item(
     """
     Create a new search history item.
     """
-    # Check if the exact same query already exists for this user recently to avoid duplicates
-    # For simplicity, we just add it now, but we could deduplicate.
+    # Repeating a query refreshes its timestamp instead of adding a duplicate
     history = crud.search_history.create_with_user(
         db, obj_in=history_in, user_id=current_user.id
     )
@@ -3,20 +3,32 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from app import crud, schemas
-from app.api.deps import get_current_active_user, get_db, invalidate_user_cache
+from app.api.deps import (
+    get_current_active_user,
+    get_current_db_user,
+    get_db,
+    invalidate_token_cache,
+    invalidate_user_cache,
+)
 from app.crud.user import user_api_key, user_mcp_server
 from app.models.user import User
 from app.schemas.user import (
     UserAPIKey,
     UserAPIKeyCreate,
-    UserAPIKeyUpdate,
     UserInstructionsUpdate,
     UserMCPServer,
     UserMCPServerCreate,
     UserMCPServerUpdate,
 )
-from app.core.security import encrypt_api_key
+from app.core.security import (
+    blacklist_token,
+    claim_datetime,
+    decode_token_claims,
+    encrypt_api_key,
+)
+from app.services.llm_service import llm_service
 from app.utils.cookies import clear_auth_cookie
+from app.utils.etag import etag_response
 
 logger = logging.getLogger(__name__)
 
@@ -25,18 +37,20 @@ router = APIRouter()
 
 @router.get("/users/me", response_model=schemas.User)
 def read_user_me(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get current user.
+    Served from the cached user row; answers 304 when the client's ETag matches.
     """
-    return current_user
+    return etag_response(request, schemas.User.model_validate(current_user))
 
 
 @router.put("/users/me", response_model=schemas.User)
 def update_user_me(
     user_in: schemas.UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -44,14 +58,13 @@ def update_user_me(
     """
     invalidate_user_cache(current_user.id)
 
-    db_user = crud.user.get(db, id=current_user.id)
-    return crud.user.update(db, db_obj=db_user, obj_in=user_in)
+    return crud.user.update(db, db_obj=current_user, obj_in=user_in)
 
 
 @router.patch("/users/me/instructions", response_model=schemas.User)
 def update_user_instructions(
     instr_in: UserInstructionsUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -59,9 +72,8 @@ def update_user_instructions(
     """
     invalidate_user_cache(current_user.id)
 
-    db_user = crud.user.get(db, id=current_user.id)
     user_update = schemas.UserUpdate(custom_instructions=instr_in.custom_instructions)
-    return crud.user.update(db, db_obj=db_user, obj_in=user_update)
+    return crud.user.update(db, db_obj=current_user, obj_in=user_update)
 
 
 @router.post("/users/me/api-keys", response_model=UserAPIKey)
@@ -73,28 +85,16 @@ def set_api_key(
     """
     Set or update an API key for a model.
     """
-    existing = user_api_key.get_by_user_and_model(
-        db, user_id=current_user.id, model_name=api_key_in.model_name
-    )
-
-    raw_key = api_key_in.api_key
-    encrypted_key = encrypt_api_key(raw_key)
-
-    if existing:
-        return user_api_key.update(
-            db,
-            db_obj=existing,
-            obj_in=UserAPIKeyUpdate(encrypted_key=encrypted_key),
-        )
+    encrypted_key = encrypt_api_key(api_key_in.api_key)
 
-    return user_api_key.create(
+    key_obj = user_api_key.upsert(
         db,
-        obj_in={
-            "model_name": api_key_in.model_name,
-            "encrypted_key": encrypted_key,
-        },
         user_id=current_user.id,
+        model_name=api_key_in.model_name,
+        encrypted_key=encrypted_key,
     )
+    llm_service.invalidate_available_models(current_user.id)
+    return key_obj
 
 
 @router.get("/users/me/api-keys", response_model=List[UserAPIKey])
@@ -134,6 +134,7 @@ def delete_api_key(
     )
     if not key_obj:
         raise HTTPException(status_code=404, detail="API key not found")
+    llm_service.invalidate_available_models(current_user.id)
     return {"message": "API key deleted successfully"}
 
 
@@ -203,15 +204,13 @@ def delete_user_me(
     """Delete current user account and all associated data."""
     invalidate_user_cache(current_user.id)
 
-    from app.core.security import extract_token_jti, get_token_expires_at
-    from app.crud.token_blacklist import token_blacklist_crud
-
     token = request.cookies.get("access_token")
     if token:
-        token_jti = extract_token_jti(token)
-        expires_at = get_token_expires_at(token)
+        claims = decode_token_claims(token)
+        token_jti = claims.get("jti")
+        expires_at = claim_datetime(claims, "exp")
         if token_jti:
-            token_blacklist_crud.create_blacklist_entry(
+            blacklist_token(
                 db=db,
                 token_jti=token_jti,
                 user_id=current_user.id,
@@ -220,10 +219,9 @@ def delete_user_me(
                 reason="account_deletion",
                 expires_at=expires_at,
             )
+        invalidate_token_cache(token)
 
-    from app.crud.user import user
-
-    user.remove(db, id=current_user.id)
+    crud.user.remove(db, id=current_user.id)
     clear_auth_cookie(response)
     return None
 
@@ -1,6 +1,6 @@
 import logging
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -10,11 +10,36 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # How Alembic migrations run at startup. With "sync" or "async" Alembic
+    # owns the schema and main.py does not call create_all().
+    MIGRATION_MODE: Literal["sync", "async", "skip"] = "skip"
+    # Open a fresh connection per checkout instead of pooling; set this when
+    # an external pooler such as PgBouncer already multiplexes connections
+    DATABASE_NULL_POOL: bool = False
 
     # Auth
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Seconds between purges of expired token_blacklist rows; 0 disables
+    TOKEN_BLACKLIST_PURGE_INTERVAL: int = 3600
+
+    # Threads available to sync (def) endpoints. Matches the DB pool's
+    # pool_size + max_overflow so a request thread is never the bottleneck
+    # while connections are still free; AnyIO's default is 40.
+    THREADPOOL_SIZE: int = 60
+
+    # Worker processes for CPU-bound document parsing, so extracting a large
+    # PDF never holds the GIL the event loop needs. 0 parses in a thread.
+    DOCUMENT_PARSE_WORKERS: int = 2
+
+    # Response compression. Level 1 keeps most of the size win on JSON and
+    # SSE for a fraction of the CPU of zlib's default; bodies under
+    # GZIP_MIN_SIZE bytes are sent as-is.
+    GZIP_LEVEL: int = 1
+    GZIP_MIN_SIZE: int = 1024
+    # zstd level for SSE streams when the client accepts zstd
+    ZSTD_LEVEL: int = 3
 
     # Encryption
     FERNET_KEY: Optional[str] = None
@@ -0,0 +1,86 @@
+"""
+Helpers for Alembic revision scripts that build indexes concurrently.
+
+``alembic/env.py`` applies ``MIGRATION_TIMEOUTS`` to the migration
+connection so transactional DDL fails fast instead of queueing behind
+long-running transactions. ``CREATE INDEX CONCURRENTLY`` must not run
+under them: it waits for every older transaction to finish and a large
+build can take longer than the statement timeout. A build that is cut
+short leaves an INVALID index under the target name, which
+``IF NOT EXISTS`` would then keep forever.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+import sqlalchemy as sa
+
+from alembic import op
+
+MIGRATION_TIMEOUTS = (
+    "SET lock_timeout = '5s'",
+    "SET statement_timeout = '10min'",
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+@contextmanager
+def concurrent_index_block() -> Iterator[None]:
+    """``autocommit_block()`` with the migration timeouts lifted.
+
+    The timeouts are restored on exit so later transactional DDL in the
+    same run still fails fast.
+    """
+    with op.get_context().autocommit_block():
+        if not _is_postgresql():
+            yield
+            return
+        op.execute("SET lock_timeout = 0")
+        op.execute("SET statement_timeout = 0")
+        try:
+            yield
+        finally:
+            for statement in MIGRATION_TIMEOUTS:
+                op.execute(statement)
+
+
+def drop_invalid_index(name: str) -> None:
+    """Drop ``name`` if it is left over from a failed concurrent build."""
+    if not _is_postgresql() or op.get_context().as_sql:
+        return
+    invalid = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT NOT indisvalid FROM pg_index "
+                "WHERE indexrelid = to_regclass(:name)"
+            ),
+            {"name": name},
+        )
+        .scalar()
+    )
+    if invalid:
+        op.drop_index(name, postgresql_concurrently=True, if_exists=True)
+
+
+def create_index_concurrently(
+    name: str, table_name: str, columns: Sequence, **kw
+) -> None:
+    """``CREATE INDEX CONCURRENTLY IF NOT EXISTS`` that survives a retry.
+
+    Must be called inside ``concurrent_index_block()``. An INVALID index
+    from an earlier failed attempt is dropped first, so the retry builds
+    a usable one instead of skipping it.
+    """
+    drop_invalid_index(name)
+    op.create_index(
+        name,
+        table_name,
+        columns,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+        **kw,
+    )
@@ -0,0 +1,132 @@
+"""
+Alembic migration runner used by the application lifespan.
+
+``MIGRATION_MODE`` controls how migrations run at startup:
+
+- ``skip``: migrations are run out-of-band (e.g. ``alembic upgrade head``
+  before uvicorn starts, as in ``docker-compose.yml``).
+- ``sync``: startup blocks until ``alembic upgrade head`` has finished.
+- ``async``: migrations run in a background task so the app can serve
+  non-DB endpoints (``/health``) while DDL is still executing.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from pathlib import Path
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+_BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Key for the session-level advisory lock every worker takes before upgrading
+_MIGRATION_LOCK_ID = 7_242_019
+
+
+class MigrationStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+migration_status: MigrationStatus = MigrationStatus.PENDING
+
+
+def _set_status(new_status: MigrationStatus) -> None:
+    global migration_status
+    migration_status = new_status
+
+
+def migrations_ready() -> bool:
+    """Whether DB-dependent routes may be served."""
+    return migration_status in (MigrationStatus.DONE, MigrationStatus.SKIPPED)
+
+
+@contextmanager
+def _migration_lock() -> Iterator[None]:
+    """Serialise upgrades across processes with ``pg_advisory_lock``.
+
+    Each uvicorn worker runs the lifespan, so without the lock several of
+    them would apply the same revisions at once. The connection runs in
+    autocommit so it holds no transaction open while the DDL executes.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": _MIGRATION_LOCK_ID})
+        try:
+            yield
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:id)"), {"id": _MIGRATION_LOCK_ID}
+            )
+
+
+def run_migrations() -> None:
+    """Run ``alembic upgrade head`` in the current thread."""
+    from alembic import command
+    from alembic.config import Config
+
+    # Build the config without an ini file so env.py does not call
+    # ``fileConfig`` and reset the application's logging setup.
+    cfg = Config()
+    cfg.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+
+    _set_status(MigrationStatus.RUNNING)
+    try:
+        with _migration_lock():
+            command.upgrade(cfg, "head")
+    except Exception:
+        _set_status(MigrationStatus.FAILED)
+        raise
+    _set_status(MigrationStatus.DONE)
+    logger.info("Database migrations completed")
+
+
+async def run_migrations_async() -> None:
+    """Run migrations in a worker thread without blocking the event loop."""
+    try:
+        await asyncio.to_thread(run_migrations)
+    except Exception:
+        # Recorded in ``migration_status``; the app keeps serving /health.
+        logger.exception("Database migrations failed")
+
+
+async def start_migrations(mode: str) -> asyncio.Task | None:
+    """Kick off migrations according to ``MIGRATION_MODE``.
+
+    Returns the background task in ``async`` mode so the caller can keep a
+    reference to it (and cancel it on shutdown).
+    """
+    if mode == "sync":
+        await asyncio.to_thread(run_migrations)
+        return None
+    if mode == "async":
+        return asyncio.create_task(run_migrations_async())
+
+    _set_status(MigrationStatus.SKIPPED)
+    return None
+
+
+async def require_migrations_complete() -> None:
+    """Dependency rejecting DB-backed requests until migrations finish.
+
+    ``async`` because it only reads a module global: a plain ``def`` would
+    cost every API request a threadpool hop.
+    """
+    if not migrations_ready():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Database migrations {migration_status.value}",
+            headers={"Retry-After": "5"},
+        )
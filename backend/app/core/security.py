@@ -1,9 +1,12 @@
+import asyncio
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 from cryptography.fernet import Fernet
 import os
+import threading
+import time
 import uuid
 import logging
 from sqlalchemy.orm import Session
@@ -47,7 +50,110 @@ def create_access_token(
     return encoded_jwt, token_jti
 
 
-def verify_token(token: str, db: Session = None):
+class BlacklistFilter:
+    """Process-local set of blacklisted JTIs used to skip the DB lookup.
+
+    The set is rebuilt from ``token_blacklist`` at most every
+    ``REFRESH_INTERVAL`` seconds. A JTI that is not in the set is treated as
+    not blacklisted; a hit is still confirmed against the database.
+    Entries blacklisted by this process are added immediately, entries from
+    other workers show up on the next refresh.
+    """
+
+    REFRESH_INTERVAL = 30
+
+    def __init__(self):
+        self._jtis: set[str] = set()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _refresh_if_stale(self, db: Session) -> None:
+        now = time.monotonic()
+        if (
+            self._loaded_at is not None
+            and now - self._loaded_at < self.REFRESH_INTERVAL
+        ):
+            return
+        with self._lock:
+            if (
+                self._loaded_at is not None
+                and now - self._loaded_at < self.REFRESH_INTERVAL
+            ):
+                return
+            self._jtis = set(token_blacklist_crud.get_active_jtis(db))
+            self._loaded_at = now
+
+    def might_contain(self, db: Session, token_jti: str) -> bool:
+        self._refresh_if_stale(db)
+        return token_jti in self._jtis
+
+    def add(self, token_jti: str) -> None:
+        self._jtis.add(token_jti)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._jtis = set()
+            self._loaded_at = None
+
+
+blacklist_filter = BlacklistFilter()
+
+
+def blacklist_token(
+    db: Session,
+    *,
+    token_jti: str,
+    user_id: Optional[int],
+    token_content: str,
+    reason: str,
+    expires_at: Optional[datetime] = None,
+    token_type: str = "access",
+) -> None:
+    """Blacklist a JTI and add it to this process's ``blacklist_filter``."""
+    token_blacklist_crud.create_blacklist_entry(
+        db,
+        token_jti=token_jti,
+        user_id=user_id,
+        token_content=token_content,
+        token_type=token_type,
+        reason=reason,
+        expires_at=expires_at,
+    )
+    blacklist_filter.add(token_jti)
+
+
+def purge_expired_blacklist_entries() -> int:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return token_blacklist_crud.purge_expired(db)
+    finally:
+        db.close()
+
+
+async def purge_expired_blacklist_periodically(interval: int) -> None:
+    """Background loop that keeps ``token_blacklist`` from growing unbounded."""
+    from app.core import migrations
+
+    while True:
+        await asyncio.sleep(interval)
+        if not migrations.migrations_ready():
+            continue
+        try:
+            deleted = await asyncio.to_thread(purge_expired_blacklist_entries)
+            if deleted:
+                logging.info(f"Purged {deleted} expired token blacklist entries")
+        except Exception as e:
+            logging.error(f"Token blacklist purge failed: {e}")
+
+
+def verify_token_claims(token: str, db: Session = None) -> Optional[dict]:
+    """Validate a token and return its decoded claims.
+
+    Returns ``None`` if the signature is invalid, ``sub``/``jti`` are
+    missing, or (when ``db`` is given) the token has been blacklisted.
+    """
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -62,51 +168,61 @@ def verify_token(token: str, db: Session = None):
             )
             return None
 
-        if db and token_blacklist_crud.is_token_blacklisted(db, token_jti=token_jti):
+        if (
+            db
+            and blacklist_filter.might_contain(db, token_jti)
+            and token_blacklist_crud.is_token_blacklisted(db, token_jti=token_jti)
+        ):
             logging.info(f"Token blacklisted: jti={token_jti}")
             return None
 
-        return user_id
+        return payload
     except JWTError as e:
         logging.warning(f"JWT validation error: {e}")
         return None
 
 
-def get_token_issued_at(token: str) -> Optional[datetime]:
-    """Extract the iat (issued at) claim from a token."""
+def verify_token(token: str, db: Session = None):
+    payload = verify_token_claims(token, db)
+    return payload.get("sub") if payload else None
+
+
+def decode_token_claims(token: str) -> dict:
+    """Decode a token's claims without verifying the signature.
+
+    Returns an empty dict if the token cannot be parsed. Use this when
+    several claims are needed from the same token so it is decoded once.
+    """
     try:
-        unverified = jwt.decode(
+        return jwt.decode(
             token, settings.SECRET_KEY, options={"verify_signature": False}
         )
-        iat_timestamp = unverified.get("iat")
-        if iat_timestamp:
-            return datetime.fromtimestamp(iat_timestamp, tz=UTC)
+    except JWTError:
+        return {}
+
+
+def claim_datetime(claims: dict, name: str) -> Optional[datetime]:
+    """Convert a numeric date claim (``iat``, ``exp``) to an aware datetime."""
+    timestamp = claims.get(name)
+    if not timestamp:
         return None
-    except (JWTError, ValueError):
+    try:
+        return datetime.fromtimestamp(timestamp, tz=UTC)
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
+def get_token_issued_at(token: str) -> Optional[datetime]:
+    """Extract the iat (issued at) claim from a token."""
+    return claim_datetime(decode_token_claims(token), "iat")
+
+
 def extract_token_jti(token: str) -> Optional[str]:
-    try:
-        unverified = jwt.decode(
-            token, settings.SECRET_KEY, options={"verify_signature": False}
-        )
-        return unverified.get("jti")
-    except JWTError:
-        return None
+    return decode_token_claims(token).get("jti")
 
 
 def get_token_expires_at(token: str) -> Optional[datetime]:
-    try:
-        unverified = jwt.decode(
-            token, settings.SECRET_KEY, options={"verify_signature": False}
-        )
-        exp_timestamp = unverified.get("exp")
-        if exp_timestamp:
-            return datetime.fromtimestamp(exp_timestamp, tz=UTC)
-        return None
-    except (JWTError, ValueError):
-        return None
+    return claim_datetime(decode_token_claims(token), "exp")
 
 
 def get_fernet_key() -> bytes:
@@ -1,10 +1,9 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Callable
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from .config import settings
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
 
@@ -13,24 +12,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Clickjacking (X-Frame-Options)
     - MIME type sniffing (X-Content-Type-Options)
     - Man-in-the-middle attacks (Strict-Transport-Security)
+
+    Written as plain ASGI rather than ``BaseHTTPMiddleware``: it only edits
+    the ``http.response.start`` message, so body chunks (including SSE
+    streams) pass straight through instead of via an extra task and channel.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Security headers for XSS protection
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["X-Frame-Options"] = "DENY"
+        headers = {
+            # Security headers for XSS protection
+            "X-Content-Type-Options": "nosniff",
+            "X-XSS-Protection": "1; mode=block",
+            "X-Frame-Options": "DENY",
+        }
 
         # HSTS header for HTTPS enforcement (only in production)
         if getattr(settings, "ENVIRONMENT", "development") == "production":
-            response.headers["Strict-Transport-Security"] = (
+            headers["Strict-Transport-Security"] = (
                 "max-age=31536000; includeSubDomains; preload"
             )
 
         # Content Security Policy
-        csp = (
+        headers["Content-Security-Policy"] = (
             "default-src 'self'; "
             "script-src 'self'; "
             "style-src 'self' https:; "
@@ -39,15 +44,28 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "connect-src 'self' wss: https:; "
             "frame-ancestors 'none';"
         )
-        response.headers["Content-Security-Policy"] = csp
 
         # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
         # Permissions policy
-        permissions_policy = (
+        headers["Permissions-Policy"] = (
             "camera=(), microphone=(), geolocation=(), payment=(), usb=()"
         )
-        response.headers["Permissions-Policy"] = permissions_policy
 
-        return response
+        # The values never change, so build them once rather than per response
+        self.headers = tuple(headers.items())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in self.headers:
+                    response_headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
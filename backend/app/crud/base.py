@@ -1,6 +1,10 @@
+from datetime import datetime
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy.orm import Session
+from sqlalchemy import asc, desc, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Query, Session
 from pydantic import BaseModel
 from app.database import Base
 
@@ -9,6 +13,39 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+_DIALECT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def dialect_insert(db: Session):
+    """Return the ``insert`` construct that supports ``ON CONFLICT`` for ``db``."""
+    return _DIALECT_INSERTS[db.get_bind().dialect.name]
+
+
+def order_by_created(
+    query: Query,
+    model: Type[Base],
+    *,
+    newest_first: bool = True,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
+) -> Query:
+    """Order ``query`` by ``(created_at, id)`` and optionally seek past a cursor.
+
+    When ``after_created_at``/``after_id`` are given, only rows strictly after
+    that position (in the requested direction) are returned, so the caller
+    can page with ``LIMIT`` alone instead of ``OFFSET``.
+    """
+    order = desc if newest_first else asc
+    if after_created_at is not None and after_id is not None:
+        key = tuple_(model.created_at, model.id)
+        position = tuple_(after_created_at, after_id)
+        query = query.filter(key < position if newest_first else key > position)
+    return query.order_by(order(model.created_at), order(model.id))
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
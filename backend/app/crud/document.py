@@ -1,4 +1,5 @@
-from typing import List, Any
+from typing import Any, Dict, List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.document import SessionDocument, DocumentChunk
@@ -17,6 +18,14 @@ class CRUDChunk(CRUDBase[DocumentChunk, ChunkCreate, Any]):
     def get_by_document(self, db: Session, *, document_id: int) -> List[DocumentChunk]:
         return db.query(self.model).filter(self.model.document_id == document_id).all()
 
+    def create_many(self, db: Session, *, objs_in: List[Dict[str, Any]]) -> int:
+        """Insert chunk rows in one executemany and a single commit."""
+        if not objs_in:
+            return 0
+        db.execute(insert(self.model), objs_in)
+        db.commit()
+        return len(objs_in)
+
 
 document = CRUDDocument(SessionDocument)
 chunk = CRUDChunk(DocumentChunk)
@@ -1,22 +1,31 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from sqlalchemy.orm import Session
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, order_by_created
 from app.models.memory import UserMemory
 from app.schemas.memory import MemoryCreate, MemoryUpdate
 
 
 class CRUDMemory(CRUDBase[UserMemory, MemoryCreate, MemoryUpdate]):
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> List[UserMemory]:
-        return (
-            db.query(self.model)
-            .filter(UserMemory.user_id == user_id)
-            .order_by(UserMemory.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        query = order_by_created(
+            db.query(self.model).filter(UserMemory.user_id == user_id),
+            UserMemory,
+            after_created_at=after_created_at,
+            after_id=after_id,
         )
+        if after_id is None:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
     def create_with_user(
         self, db: Session, *, obj_in: MemoryCreate, user_id: int
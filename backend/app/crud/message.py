@@ -1,9 +1,10 @@
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import desc, asc, func, or_
-from app.crud.base import CRUDBase
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy import delete, desc, exists, func, or_
+from app.crud.base import CRUDBase, order_by_created
 from app.models.message import Message
+from app.models.session import ChatSession
 from app.schemas.message import MessageCreate, MessageUpdate
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 
@@ -16,6 +17,7 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         response: str,
         user_id: int,
         session_id: Optional[int] = None,
+        ui_data: Optional[dict] = None,
     ) -> Message:
         db_obj = Message(
             content=obj_in.content,
@@ -24,6 +26,7 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
             user_id=user_id,
             session_id=session_id,
             images=obj_in.images,
+            ui_data=ui_data,
         )
         db.add(db_obj)
         db.flush()
@@ -41,42 +44,107 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
 
         return db_obj
 
-    def get_by_user(
+    def _filter_by_user(
         self,
-        db: Session,
+        query: Query,
         *,
         user_id: int,
-        skip: int = 0,
-        limit: int = 100,
-        newest_first: bool = True,
         search: str = None,
         session_id: Optional[int] = None,
-    ) -> List[Message]:
-        query = (
-            db.query(Message)
-            .filter(Message.user_id == user_id)
-            .options(selectinload(Message.documents))
-        )
+    ) -> Query:
+        query = query.filter(Message.user_id == user_id)
 
         if session_id:
             query = query.filter(Message.session_id == session_id)
 
         if search:
+            # Unanchored ILIKE is served by the pg_trgm GIN indexes
+            search_term = f"%{search}%"
             query = query.filter(
                 or_(
-                    Message.content.contains(search),
-                    Message.response.contains(search),
+                    Message.content.ilike(search_term),
+                    Message.response.ilike(search_term),
                 )
             )
 
-        if newest_first:
-            query = query.order_by(desc(Message.created_at))
-        else:
-            query = query.order_by(asc(Message.created_at))
+        return query
 
-        query = query.offset(skip).limit(limit)
+    def get_by_user(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        search: str = None,
+        session_id: Optional[int] = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        with_documents: bool = True,
+    ) -> List[Message]:
+        query = db.query(Message)
+        if with_documents:
+            query = query.options(selectinload(Message.documents))
+        query = self._filter_by_user(
+            query,
+            user_id=user_id,
+            search=search,
+            session_id=session_id,
+        )
+
+        query = order_by_created(
+            query,
+            Message,
+            newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+        if after_id is None:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
+    def get_page_by_user(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        search: str = None,
+        session_id: Optional[int] = None,
+        with_documents: bool = True,
+    ) -> Tuple[List[Message], int]:
+        """Return one OFFSET page together with the total match count.
+
+        The total comes from ``COUNT(*) OVER ()`` on the page query itself,
+        so the filters run once instead of again in ``count_by_user``.
+        """
+        query = db.query(Message, func.count().over().label("total"))
+        if with_documents:
+            query = query.options(selectinload(Message.documents))
+        query = self._filter_by_user(
+            query,
+            user_id=user_id,
+            search=search,
+            session_id=session_id,
+        )
+        query = order_by_created(query, Message, newest_first=newest_first)
+        rows = query.offset(skip).limit(limit).all()
 
-        return query.all()
+        if rows:
+            return [msg for msg, _ in rows], rows[0].total
+        # Past the last page the window has no rows to report a total on
+        total = (
+            self.count_by_user(
+                db, user_id=user_id, search=search, session_id=session_id
+            )
+            if skip
+            else 0
+        )
+        return [], total
 
     def get_by_session(
         self,
@@ -87,19 +155,96 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         skip: int = 0,
         limit: int = 100,
         newest_first: bool = True,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> List[Message]:
-        query = db.query(Message).filter(Message.session_id == session_id)
+        query = (
+            db.query(Message)
+            .filter(Message.session_id == session_id)
+            .options(selectinload(Message.documents))
+        )
         if user_id is not None:
             query = query.filter(Message.user_id == user_id)
 
-        if newest_first:
-            query = query.order_by(desc(Message.created_at))
-        else:
-            query = query.order_by(asc(Message.created_at))
+        query = order_by_created(
+            query,
+            Message,
+            newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+        if after_id is None:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
 
-        query = query.offset(skip).limit(limit)
+    def get_page_by_session_for_user(
+        self,
+        db: Session,
+        *,
+        session_id: int,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> Tuple[Optional[List[Message]], Optional[int]]:
+        """Return a page of a session's messages if ``user_id`` owns it.
 
-        return query.all()
+        Ownership is checked by the join to ``chat_sessions`` and, for OFFSET
+        pages, the total rides along as ``COUNT(*) OVER ()``, so a non-empty
+        page costs one statement. Keyset pages return ``None`` for the total.
+        Returns ``(None, 0)`` when the session is missing or not the user's.
+        """
+        offset_page = after_id is None
+        columns = [Message]
+        if offset_page:
+            columns.append(func.count().over().label("total"))
+
+        query = (
+            db.query(*columns)
+            .join(ChatSession, ChatSession.id == Message.session_id)
+            .filter(
+                Message.session_id == session_id,
+                Message.user_id == user_id,
+                ChatSession.user_id == user_id,
+            )
+            .options(selectinload(Message.documents))
+        )
+        query = order_by_created(
+            query,
+            Message,
+            newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+
+        if offset_page:
+            rows = query.offset(skip).limit(limit).all()
+            if rows:
+                return [msg for msg, _ in rows], rows[0].total
+        else:
+            rows = query.limit(limit).all()
+            if rows:
+                return rows, None
+
+        # An empty page is ambiguous: tell "not yours" apart from "no rows"
+        owned = db.query(
+            exists().where(
+                ChatSession.id == session_id, ChatSession.user_id == user_id
+            )
+        ).scalar()
+        if not owned:
+            return None, 0
+        if not offset_page:
+            return [], None
+        total = (
+            self.count_by_user(db, user_id=user_id, session_id=session_id)
+            if skip
+            else 0
+        )
+        return [], total
 
     def get_latest_messages(
         self, db: Session, *, user_id: int, limit: int = 10
@@ -120,15 +265,12 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         search: str = None,
         session_id: Optional[int] = None,
     ) -> int:
-        query = db.query(func.count(Message.id)).filter(Message.user_id == user_id)
-
-        if session_id:
-            query = query.filter(Message.session_id == session_id)
-
-        if search:
-            query = query.filter(
-                or_(Message.content.contains(search), Message.response.contains(search))
-            )
+        query = self._filter_by_user(
+            db.query(func.count(Message.id)),
+            user_id=user_id,
+            search=search,
+            session_id=session_id,
+        )
 
         return query.scalar()
 
@@ -140,20 +282,22 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
         before_date: Optional[str] = None,
         session_id: Optional[int] = None,
     ) -> int:
-        query = db.query(Message).filter(Message.user_id == user_id)
+        stmt = delete(Message).where(Message.user_id == user_id)
 
         if session_id:
-            query = query.filter(Message.session_id == session_id)
+            stmt = stmt.where(Message.session_id == session_id)
 
         if before_date:
             before_datetime = datetime.fromisoformat(before_date)
-            query = query.filter(Message.created_at < before_datetime)
+            stmt = stmt.where(Message.created_at < before_datetime)
 
-        to_delete_count = query.count()
-        query.delete(synchronize_session=False)
+        # One DELETE; its rowcount replaces the separate COUNT(*) pass
+        deleted = db.execute(
+            stmt.execution_options(synchronize_session=False)
+        ).rowcount
         db.commit()
 
-        return to_delete_count
+        return deleted
 
     def update(
         self,
@@ -164,6 +308,23 @@ class CRUDMessage(CRUDBase[Message, MessageCreate, MessageUpdate]):
     ) -> Message:
         return super().update(db, db_obj=db_obj, obj_in=obj_in)
 
+    def get_owner_id(self, db: Session, *, id: int) -> Optional[int]:
+        return db.query(Message.user_id).filter(Message.id == id).scalar()
+
+    def remove_if_owner(self, db: Session, *, id: int, user_id: int) -> bool:
+        """Delete a message in one statement if it belongs to ``user_id``.
+
+        ``session_documents.message_id`` is ``ON DELETE SET NULL``, so the
+        database unlinks attached documents without loading them.
+        """
+        deleted = db.execute(
+            delete(Message)
+            .where(Message.id == id, Message.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        return bool(deleted)
+
     def remove(self, db: Session, *, id: int) -> Message:
         obj = db.get(Message, id)
         if obj:
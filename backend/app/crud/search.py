@@ -1,7 +1,8 @@
 from typing import List
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.crud.base import CRUDBase
+from sqlalchemy import desc, func
+from app.crud.base import CRUDBase, dialect_insert
 from app.models.search import SearchHistory
 from app.schemas.search import SearchHistoryCreate, SearchHistory as SearchHistorySchema
 
@@ -11,16 +12,25 @@ class CRUDSearchHistory(
 ):
     def create_with_user(
         self, db: Session, *, obj_in: SearchHistoryCreate, user_id: int
-    ) -> SearchHistory:
-        db_obj = SearchHistory(
+    ) -> Row:
+        """Record a search, or bump an identical earlier one to the top.
+
+        ``ON CONFLICT (user_id, search_type, query) DO UPDATE`` keeps one row
+        per distinct query, so repeated searches don't grow the table.
+        """
+        insert = dialect_insert(db)
+        stmt = insert(SearchHistory).values(
             query=obj_in.query,
-            search_type=obj_in.search_type,
+            search_type=obj_in.search_type or "general",
             user_id=user_id,
         )
-        db.add(db_obj)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "search_type", "query"],
+            set_={"created_at": func.now()},
+        ).returning(*SearchHistory.__table__.c)
+        row = db.execute(stmt).first()
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return row
 
     def get_by_user(
         self, db: Session, *, user_id: int, limit: int = 10
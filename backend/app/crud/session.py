@@ -1,15 +1,20 @@
 import logging
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
-from app.crud.base import CRUDBase
+from sqlalchemy.orm import Query, Session, load_only, raiseload
+from sqlalchemy import delete, desc, asc, func, or_, select, update
+from sqlalchemy.engine import Row
+from app.crud.base import CRUDBase, order_by_created
 from app.models.session import ChatSession
 from app.models.message import Message  # Import Message for optimized queries
 from app.schemas.session import ChatSessionCreate, ChatSessionUpdate
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
+from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
+# Title given to sessions the client creates before the first message
+DEFAULT_TITLE = "New Chat"
+
 
 class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate]):
     def create(
@@ -32,6 +37,22 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
             logger.error(f"Error creating session: {e}")
             raise
 
+    def get_summary(self, db: Session, *, id: int) -> Optional[ChatSession]:
+        """
+        Fetch only the columns needed for ownership and title checks.
+        Relationships are set to raise so an accidental lazy load fails loudly
+        instead of issuing extra SELECTs.
+        """
+        return (
+            db.query(ChatSession)
+            .options(
+                load_only(ChatSession.id, ChatSession.user_id, ChatSession.title),
+                raiseload("*"),
+            )
+            .filter(ChatSession.id == id)
+            .one_or_none()
+        )
+
     def get_by_user(
         self,
         db: Session,
@@ -57,6 +78,48 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
 
         return query.all()
 
+    def _with_message_count_query(
+        self, db: Session, *columns, user_id: int, search: str = None
+    ) -> Query:
+        # Correlated count per returned session: one query for the page,
+        # and only the user's sessions are counted rather than every
+        # session in the table
+        message_count = (
+            select(func.count(Message.id))
+            .where(Message.session_id == ChatSession.id)
+            .correlate(ChatSession)
+            .scalar_subquery()
+            .label("message_count")
+        )
+
+        query = db.query(ChatSession, message_count, *columns).filter(
+            ChatSession.user_id == user_id
+        )
+
+        return self._filter_search(query, search)
+
+    @staticmethod
+    def _filter_search(query: Query, search: str = None) -> Query:
+        if search:
+            search_term = f"%{search}%"
+            query = query.filter(
+                (ChatSession.title.ilike(search_term))
+                | (ChatSession.description.ilike(search_term))
+            )
+        return query
+
+    @staticmethod
+    def _to_dict(session: ChatSession, message_count: Optional[int]) -> dict:
+        return {
+            "id": session.id,
+            "user_id": session.user_id,
+            "title": session.title,
+            "description": session.description,
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
+            "message_count": int(message_count or 0),
+        }
+
     def get_by_user_with_message_count(
         self,
         db: Session,
@@ -66,63 +129,63 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
         limit: int = 100,
         newest_first: bool = True,
         search: str = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> List[dict]:
         """
         Retrieve chat sessions with message count for a user
         Uses optimized query with proper eager loading to prevent N+1 queries
         """
-        # Use subquery for message count to avoid N+1 queries
-        message_count_subquery = (
-            db.query(
-                ChatSession.id.label("session_id"),
-                func.count(Message.id).label("message_count"),
-            )
-            .outerjoin(ChatSession.messages)
-            .group_by(ChatSession.id)
-            .subquery()
-        )
+        query = self._with_message_count_query(db, user_id=user_id, search=search)
 
-        query = (
-            db.query(ChatSession, message_count_subquery.c.message_count)
-            .filter(ChatSession.user_id == user_id)
-            .join(
-                message_count_subquery,
-                ChatSession.id == message_count_subquery.c.session_id,
-                isouter=True,
-            )
+        # Order by (created_at, id); seek past the cursor when one is given,
+        # otherwise fall back to OFFSET pagination
+        query = order_by_created(
+            query,
+            ChatSession,
+            newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
         )
+        if after_id is None:
+            query = query.offset(skip)
+        query = query.limit(limit)
 
-        # Apply search filter if provided
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (ChatSession.title.ilike(search_term))
-                | (ChatSession.description.ilike(search_term))
-            )
-
-        # Apply ordering - descending by created_at to get newest first
-        if newest_first:
-            query = query.order_by(desc(ChatSession.created_at))
-        else:
-            query = query.order_by(asc(ChatSession.created_at))
+        return [
+            self._to_dict(session, message_count)
+            for session, message_count in query.all()
+        ]
 
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+    def get_page_by_user_with_message_count(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        search: str = None,
+    ) -> Tuple[List[dict], int]:
+        """
+        Retrieve one OFFSET page of sessions plus the total match count.
+        The total is a COUNT(*) OVER () on the page query, which saves the
+        separate count_by_user roundtrip
+        """
+        query = self._with_message_count_query(
+            db, func.count().over().label("total"), user_id=user_id, search=search
+        )
+        query = order_by_created(query, ChatSession, newest_first=newest_first)
+        rows = query.offset(skip).limit(limit).all()
 
-        results = []
-        for session, message_count in query.all():
-            session_dict = {
-                "id": session.id,
-                "user_id": session.user_id,
-                "title": session.title,
-                "description": session.description,
-                "created_at": session.created_at,
-                "updated_at": session.updated_at,
-                "message_count": int(message_count or 0),
-            }
-            results.append(session_dict)
-
-        return results
+        if rows:
+            results = [
+                self._to_dict(session, message_count)
+                for session, message_count, _ in rows
+            ]
+            return results, rows[0].total
+        # Past the last page the window has no rows to report a total on
+        total = self.count_by_user(db, user_id=user_id, search=search) if skip else 0
+        return [], total
 
     def count_by_user(self, db: Session, *, user_id: int, search: str = None) -> int:
         """
@@ -132,15 +195,7 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
             ChatSession.user_id == user_id
         )
 
-        # Apply search filter if provided
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (ChatSession.title.ilike(search_term))
-                | (ChatSession.description.ilike(search_term))
-            )
-
-        return query.scalar()
+        return self._filter_search(query, search).scalar()
 
     def update(
         self, db: Session, *, db_obj: ChatSession, obj_in: ChatSessionUpdate
@@ -156,6 +211,76 @@ class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionUpdate
         db.refresh(db_obj)
         return db_obj
 
+    def update_for_user(
+        self, db: Session, *, id: int, user_id: int, obj_in: ChatSessionUpdate
+    ) -> Optional[Union[ChatSession, Row]]:
+        """
+        Update a session only if it belongs to ``user_id``, as one
+        UPDATE ... RETURNING instead of a SELECT followed by an UPDATE.
+        Returns the updated row, or None when the user has no such session
+        """
+        owned = (ChatSession.id == id, ChatSession.user_id == user_id)
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            return db.query(ChatSession).filter(*owned).first()
+
+        # Plain columns rather than the entity, so the row stays readable
+        # after the commit expires the session's ORM state
+        row = db.execute(
+            update(ChatSession)
+            .where(*owned)
+            .values(**update_data)
+            .returning(*ChatSession.__table__.c)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.commit()
+        return row
+
+    def remove_for_user(self, db: Session, *, id: int, user_id: int) -> bool:
+        """
+        Delete a session and its messages if it belongs to ``user_id``,
+        without loading either. Documents and their chunks are removed by
+        their ON DELETE CASCADE foreign keys. Returns whether it existed
+        """
+        owned_session = select(ChatSession.id).where(
+            ChatSession.id == id, ChatSession.user_id == user_id
+        )
+        db.execute(
+            delete(Message)
+            .where(Message.session_id.in_(owned_session))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(
+            delete(ChatSession)
+            .where(ChatSession.id == id, ChatSession.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        return bool(deleted)
+
+    def update_title_if_default(
+        self, db: Session, *, id: int, user_id: int, title: str
+    ) -> bool:
+        """
+        Set the title of a session that still has the default (or an empty)
+        title, in a single conditional UPDATE. Returns whether a row changed
+        """
+        updated = (
+            db.query(ChatSession)
+            .filter(
+                ChatSession.id == id,
+                ChatSession.user_id == user_id,
+                or_(
+                    ChatSession.title.is_(None),
+                    ChatSession.title == DEFAULT_TITLE,
+                    func.trim(ChatSession.title) == "",
+                ),
+            )
+            .update({ChatSession.title: title}, synchronize_session=False)
+        )
+        db.commit()
+        return bool(updated)
+
     def remove(self, db: Session, *, id: int) -> Optional[ChatSession]:
         """
         Remove a specific chat session by ID
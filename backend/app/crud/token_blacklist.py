@@ -1,5 +1,6 @@
 from typing import Optional
 from sqlalchemy.orm import Session
+from app.crud.base import dialect_insert
 from app.models.token_blacklist import TokenBlacklist
 from datetime import datetime, UTC
 
@@ -20,23 +21,28 @@ class TokenBlacklistCRUD:
         token_type: str = "access",
         reason: str = "logout",
         expires_at: Optional[datetime] = None,
-    ) -> TokenBlacklist:
-        existing = self.get_by_jti(db, token_jti=token_jti)
-        if existing:
-            return existing
-
-        db_obj = TokenBlacklist(
-            token_jti=token_jti,
-            user_id=user_id,
-            token_content=token_content,
-            token_type=token_type,
-            reason=reason,
-            expires_at=expires_at,
+    ) -> None:
+        """Blacklist a JTI. Re-blacklisting an existing JTI is a no-op.
+
+        Uses a single ``INSERT ... ON CONFLICT (token_jti) DO NOTHING`` so
+        concurrent logouts of the same token cannot race on the unique
+        constraint.
+        """
+        insert = dialect_insert(db)
+        stmt = (
+            insert(TokenBlacklist)
+            .values(
+                token_jti=token_jti,
+                user_id=user_id,
+                token_content=token_content,
+                token_type=token_type,
+                reason=reason,
+                expires_at=expires_at,
+            )
+            .on_conflict_do_nothing(index_elements=["token_jti"])
         )
-        db.add(db_obj)
+        db.execute(stmt)
         db.commit()
-        db.refresh(db_obj)
-        return db_obj
 
     def get_by_jti(self, db: Session, *, token_jti: str) -> Optional[TokenBlacklist]:
         return (
@@ -45,8 +51,41 @@ class TokenBlacklistCRUD:
             .first()
         )
 
+    def get_active_jtis(self, db: Session) -> list[str]:
+        """JTIs of blacklist entries that have not expired yet."""
+        rows = (
+            db.query(TokenBlacklist.token_jti)
+            .filter(
+                (TokenBlacklist.expires_at.is_(None))
+                | (TokenBlacklist.expires_at > datetime.now(UTC))
+            )
+            .all()
+        )
+        return [row.token_jti for row in rows]
+
     def is_token_blacklisted(self, db: Session, *, token_jti: str) -> bool:
-        return self.get_by_jti(db, token_jti=token_jti) is not None
+        # Select only the indexed column so PostgreSQL can answer from the
+        # unique index without loading token_content.
+        return (
+            db.query(TokenBlacklist.token_jti)
+            .filter(TokenBlacklist.token_jti == token_jti)
+            .first()
+            is not None
+        )
+
+    def purge_expired(self, db: Session) -> int:
+        """Delete entries whose token has already expired.
+
+        An expired token is rejected by signature verification anyway, so
+        its blacklist row is dead weight.
+        """
+        deleted = (
+            db.query(TokenBlacklist)
+            .filter(TokenBlacklist.expires_at < datetime.now(UTC))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
 
     def blacklist_user_tokens(
         self,
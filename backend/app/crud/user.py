@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from app.core.security import get_password_hash, verify_password
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, dialect_insert
 from app.models.user import User, UserAPIKey, UserMCPServer
 from app.schemas.user import (
     UserAPIKeyCreate,
@@ -11,6 +11,8 @@ from app.schemas.user import (
     UserMCPServerUpdate,
     UserUpdate,
 )
+from sqlalchemy import func
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 
@@ -105,6 +107,26 @@ class CRUDUserAPIKey(CRUDBase[UserAPIKey, UserAPIKeyCreate, UserAPIKeyUpdate]):
         db.refresh(db_obj)
         return db_obj
 
+    def upsert(
+        self, db: Session, *, user_id: int, model_name: str, encrypted_key: str
+    ) -> Row:
+        """Set a user's key for ``model_name`` in a single statement.
+
+        ``INSERT ... ON CONFLICT (user_id, model_name) DO UPDATE`` replaces
+        the SELECT-then-write, so concurrent sets cannot create duplicates.
+        """
+        insert = dialect_insert(db)
+        stmt = insert(UserAPIKey).values(
+            user_id=user_id, model_name=model_name, encrypted_key=encrypted_key
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "model_name"],
+            set_={"encrypted_key": stmt.excluded.encrypted_key, "updated_at": func.now()},
+        ).returning(*UserAPIKey.__table__.c)
+        row = db.execute(stmt).first()
+        db.commit()
+        return row
+
     def remove_by_user_and_model(
         self, db: Session, *, user_id: int, model_name: str
     ) -> Optional[UserAPIKey]:
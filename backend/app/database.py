@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, QueuePool
 from app.core.config import settings
 
 # PostgreSQL supports application_name; other DBs (SQLite, etc.) don't.
@@ -8,16 +8,23 @@ _connect_args = {}
 if settings.DATABASE_URL.startswith("postgresql"):
     _connect_args["application_name"] = "ChatNova"
 
+if settings.DATABASE_NULL_POOL:
+    _pool_args = {"poolclass": NullPool}
+else:
+    _pool_args = {
+        "poolclass": QueuePool,
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+        "pool_timeout": 30,
+    }
+
 engine = create_engine(
     settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=20,
-    max_overflow=40,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_timeout=30,
     echo=False,
     connect_args=_connect_args,
+    **_pool_args,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,17 +1,23 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from app.api.v1 import auth, chat, users, memories, search
 from app.database import engine, Base
 from app.core.config import settings
+from app.core import migrations
+from app.core.security import purge_expired_blacklist_periodically
 from fastapi.middleware.gzip import GZipMiddleware
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.services.web_search import web_search_service
+from app.services.document_task_service import shutdown_parse_pool, start_parse_pool
 from app.services.session_service import session_service
 from app.services.ai_chat import ai_service
 session_service.configure(ai_service.clear_session_memory)
@@ -22,20 +28,46 @@ logging.basicConfig(
     force=True,
 )
 
-try:
-    Base.metadata.create_all(bind=engine)
-except Exception as e:
-    logging.error(f"Database connection failed: {e}. Make sure PostgreSQL is running.")
+# Creating the tables here would make Alembic's first CREATE TABLE fail, so
+# only do it when migrations are run out-of-band.
+if settings.MIGRATION_MODE == "skip":
+    try:
+        Base.metadata.create_all(bind=engine)
+    except Exception as e:
+        logging.error(
+            f"Database connection failed: {e}. Make sure PostgreSQL is running."
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.THREADPOOL_SIZE
+    )
+    migration_task = await migrations.start_migrations(settings.MIGRATION_MODE)
+    purge_task = None
+    if settings.TOKEN_BLACKLIST_PURGE_INTERVAL > 0:
+        purge_task = asyncio.create_task(
+            purge_expired_blacklist_periodically(
+                settings.TOKEN_BLACKLIST_PURGE_INTERVAL
+            )
+        )
     web_search_service.start()
+    start_parse_pool(settings.DOCUMENT_PARSE_WORKERS)
     yield
+    shutdown_parse_pool()
     web_search_service.shutdown()
+    for task in (migration_task, purge_task):
+        if task is not None and not task.done():
+            task.cancel()
 
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
+app = FastAPI(
+    title=settings.PROJECT_NAME,
+    version=settings.VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 if settings.ENVIRONMENT == "testing":
     limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
@@ -45,7 +77,11 @@ else:
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MIN_SIZE,
+    compresslevel=settings.GZIP_LEVEL,
+)
 
 app.add_middleware(SecurityHeadersMiddleware)
 
@@ -62,8 +98,27 @@ app.add_middleware(
     ],
 )
 
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
-app.include_router(chat.router, prefix="/api/v1", tags=["chat"])
-app.include_router(users.router, prefix="/api/v1", tags=["users"])
-app.include_router(memories.router, prefix="/api/v1", tags=["memories"])
-app.include_router(search.router, prefix="/api/v1/search", tags=["search"])
+_db_ready = [Depends(migrations.require_migrations_complete)]
+
+app.include_router(
+    auth.router, prefix="/api/v1/auth", tags=["auth"], dependencies=_db_ready
+)
+app.include_router(chat.router, prefix="/api/v1", tags=["chat"], dependencies=_db_ready)
+app.include_router(
+    users.router, prefix="/api/v1", tags=["users"], dependencies=_db_ready
+)
+app.include_router(
+    memories.router, prefix="/api/v1", tags=["memories"], dependencies=_db_ready
+)
+app.include_router(
+    search.router, prefix="/api/v1/search", tags=["search"], dependencies=_db_ready
+)
+
+
+@app.get("/health", tags=["health"])
+def health():
+    """Liveness probe; reports migration progress without touching the DB."""
+    return {
+        "status": "ok" if migrations.migrations_ready() else "starting",
+        "migrations": migrations.migration_status.value,
+    }
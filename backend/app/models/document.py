@@ -39,7 +39,7 @@ else:
 class SessionDocument(Base):
     __tablename__ = "session_documents"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     filename = Column(String, nullable=False)
     file_type = Column(String, nullable=False)  # pdf, image, docx, txt, etc.
     file_path = Column(String, nullable=True)
@@ -67,7 +67,7 @@ class SessionDocument(Base):
 class DocumentChunk(Base):
     __tablename__ = "document_chunks"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     document_id = Column(
         Integer, ForeignKey("session_documents.id", ondelete="CASCADE"), nullable=False
     )
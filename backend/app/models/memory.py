@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,8 +7,8 @@ from ..database import Base
 class UserMemory(Base):
     __tablename__ = "user_memories"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     last_accessed_at = Column(
@@ -16,3 +16,8 @@ class UserMemory(Base):
     )
 
     user = relationship("User", back_populates="memories")
+
+    # Serves "list a user's memories, newest first" and its keyset pages
+    __table_args__ = (
+        Index("ix_user_memories_user_created", user_id, created_at.desc()),
+    )
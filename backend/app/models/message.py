@@ -1,4 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    ForeignKey,
+    DateTime,
+    JSON,
+    Index,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,8 +16,8 @@ from ..database import Base
 class Message(Base):
     __tablename__ = "messages"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
     session_id = Column(
         Integer, ForeignKey("chat_sessions.id"), index=True, nullable=True
     )
@@ -21,3 +30,15 @@ class Message(Base):
 
     session = relationship("ChatSession", back_populates="messages")
     documents = relationship("SessionDocument", back_populates="message")
+
+    # Range scans on a user's messages by date (history listing, keyset
+    # pagination, before_date deletes); session_id rides along so session
+    # filters don't need a heap fetch
+    __table_args__ = (
+        Index(
+            "ix_messages_user_created",
+            user_id,
+            created_at.desc(),
+            postgresql_include=["session_id"],
+        ),
+    )
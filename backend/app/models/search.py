@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,10 +7,17 @@ from ..database import Base
 class SearchHistory(Base):
     __tablename__ = "search_history"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
     query = Column(String, index=True)
     search_type = Column(String, default="general")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     user = relationship("User", back_populates="search_history")
+
+    # One row per distinct query; repeating a search refreshes created_at
+    __table_args__ = (
+        Index(
+            "uq_search_history_user_query", user_id, search_type, query, unique=True
+        ),
+    )
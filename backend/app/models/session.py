@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,13 +7,13 @@ from ..database import Base
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
-    title = Column(String(255), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    title = Column(String(255))
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
-        DateTime(timezone=True), default=func.now(), onupdate=func.now(), index=True
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
     )
 
     # Relationship to messages
@@ -26,5 +26,8 @@ class ChatSession(Base):
         "SessionDocument", back_populates="session", cascade="all, delete-orphan"
     )
 
-    # Additional indexes for performance
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    # Serves "list a user's sessions, newest first" without a sort
+    __table_args__ = (
+        Index("ix_chat_sessions_user_created", user_id, created_at.desc()),
+        {"mysql_engine": "InnoDB"},
+    )
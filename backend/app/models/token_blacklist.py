@@ -6,11 +6,10 @@ from ..database import Base
 class TokenBlacklist(Base):
     __tablename__ = "token_blacklist"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     token_jti = Column(
         String(255),
         unique=True,
-        index=True,
         nullable=False,
         comment="JWT ID for tracking",
     )
@@ -35,7 +34,6 @@ class TokenBlacklist(Base):
 
     # Indexes for performance
     __table_args__ = (
-        Index("idx_token_jti", "token_jti"),
         Index("idx_user_id", "user_id"),
         Index("idx_expires_at", "expires_at"),
         {"mysql_engine": "InnoDB"},
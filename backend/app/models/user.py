@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..database import Base
@@ -7,7 +7,7 @@ from ..database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
     is_active = Column(Boolean, default=True)
@@ -33,8 +33,8 @@ class User(Base):
 class UserAPIKey(Base):
     __tablename__ = "user_api_keys"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
     model_name = Column(String, index=True)
     encrypted_key = Column(String)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -42,11 +42,16 @@ class UserAPIKey(Base):
 
     user = relationship("User", back_populates="api_keys")
 
+    # One key per provider per user; also the ON CONFLICT target for upsert
+    __table_args__ = (
+        Index("uq_user_api_keys_user_model", user_id, model_name, unique=True),
+    )
+
 
 class UserMCPServer(Base):
     __tablename__ = "user_mcp_servers"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), index=True)
     mcp_servers_config = Column(String)  # JSON string containing mcpServers config
     created_at = Column(DateTime(timezone=True), server_default=func.now())
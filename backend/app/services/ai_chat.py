@@ -86,7 +86,7 @@ class AgentStreamingCallbackHandler(AsyncCallbackHandler):
             "input": input_str,
             "tool_call_id": run_id,
         }
-        await self.queue.put(json.dumps(event))
+        await self.queue.put(event)
 
     async def on_tool_end(self, output: str, **kwargs: Any) -> None:
         run_id = str(kwargs.get("run_id", ""))
@@ -95,11 +95,11 @@ class AgentStreamingCallbackHandler(AsyncCallbackHandler):
             "output": output,
             "tool_call_id": run_id,
         }
-        await self.queue.put(json.dumps(event))
+        await self.queue.put(event)
 
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         event = {"type": "content", "content": token}
-        await self.queue.put(json.dumps(event))
+        await self.queue.put(event)
 
 
 class AIChatService:
@@ -252,7 +252,8 @@ class AIChatService:
 
     async def agent_chat_stream(
         self, message, model_name, user_id=None, db=None, session_id=None
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield agent events as dicts; the endpoint serializes them once."""
         sanitize_user_input(message)
         try:
             mcp_config = (
@@ -261,11 +262,11 @@ class AIChatService:
                 else {"mcpServers": {}}
             )
             if not mcp_config.get("mcpServers"):
-                yield json.dumps({"type": "error", "content": "No MCP servers configured."})
+                yield {"type": "error", "content": "No MCP servers configured."}
                 return
             llm = llm_service.get_llm(model_name, user_id, db, streaming=True)
             if not llm:
-                yield json.dumps({"type": "error", "content": "Invalid model."})
+                yield {"type": "error", "content": "Invalid model."}
                 return
             messages = await self._build_agent_messages(message, user_id, db, llm, session_id)
             server_config = {
@@ -284,23 +285,16 @@ class AIChatService:
             task = asyncio.create_task(
                 self._agent_loop(llm, tools, messages, callbacks=[handler])
             )
-            full_response = ""
             while not task.done() or not queue.empty():
                 try:
                     item = await asyncio.wait_for(queue.get(), timeout=0.1)
                     yield item
-                    try:
-                        data = json.loads(item)
-                        if data.get("type") == "content":
-                            full_response += data.get("content", "")
-                    except (json.JSONDecodeError, KeyError, Exception):
-                        pass
                 except asyncio.TimeoutError:
                     continue
             if task.done() and task.exception():
-                yield json.dumps({"type": "error", "content": str(task.exception())})
+                yield {"type": "error", "content": str(task.exception())}
         except Exception as e:
-            yield json.dumps({"type": "error", "content": str(e)})
+            yield {"type": "error", "content": str(e)}
 
     async def simple_chat(
         self,
@@ -451,14 +445,18 @@ class AIChatService:
             f"search_web={search_web}, model={model_name}"
         )
 
-    def transcribe_audio(self, audio_file, filename="audio.wav", user_id=None, db=None) -> str:
-        api_key = llm_service.get_provider_key("Groq", user_id, db)
+    async def transcribe_audio(self, audio_file, api_key: str, filename="audio.wav") -> str:
+        """Transcribe with Groq Whisper. Takes a resolved key so callers can
+        release their DB session before the network round-trip."""
         if not api_key:
             raise ValueError("Groq API key missing.")
-        client = groq.Groq(api_key=api_key)
         audio_io = BytesIO(audio_file)
         audio_io.name = filename
-        return client.audio.transcriptions.create(file=audio_io, model="whisper-large-v3", language="en").text
+        async with groq.AsyncGroq(api_key=api_key) as client:
+            result = await client.audio.transcriptions.create(
+                file=audio_io, model="whisper-large-v3", language="en"
+            )
+        return result.text
 
 
 ai_service = AIChatService()
@@ -43,3 +43,15 @@ class DocumentProcessor:
             length_function=len,
         )
         return splitter.split_text(DocumentProcessor._sanitize_text(text))
+
+
+def extract_chunks(file_path: str, file_type: str) -> List[str]:
+    """Extract and chunk a file in one call.
+
+    Module-level so it pickles by reference into a process pool worker;
+    only the file path goes in and only the chunk strings come back.
+    """
+    text = DocumentProcessor.extract_text(file_path, file_type)
+    if not text:
+        return []
+    return DocumentProcessor.chunk_text(text)
@@ -4,17 +4,53 @@ Extracted from the API router (chat.py) to maintain clean architectural
 boundaries between transport and business logic.
 """
 
+import asyncio
 import logging
-from typing import Any, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
 
 from app.crud.document import chunk as chunk_crud
 from app.crud.document import document as document_crud
-from app.services.document_processor import DocumentProcessor
+from app.services.document_processor import extract_chunks
 from app.services.embedding_service import EmbeddingService
 from app.models.document import has_vector
 
 logger = logging.getLogger(__name__)
 
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_parse_pool(workers: int) -> None:
+    """Create the shared parsing pool; ``workers <= 0`` keeps parsing in a thread."""
+    global _parse_pool
+    if workers > 0 and _parse_pool is None:
+        # forkserver, not the Linux default fork: workers start lazily inside
+        # a running, multithreaded server, and a forked child could inherit
+        # a lock held by another thread or the pooled DB sockets.
+        # extract_chunks only needs a path, so nothing else must be inherited.
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+
+def shutdown_parse_pool() -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def _parse_document(file_path: str, file_type: str) -> List[str]:
+    """Extract and chunk off the event loop, in the process pool when running."""
+    if _parse_pool is None:
+        return await run_in_threadpool(extract_chunks, file_path, file_type)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_parse_pool, extract_chunks, file_path, file_type)
+
 
 async def process_document_task(
     file_path: str,
@@ -45,30 +81,34 @@ async def process_document_task(
         db.add(doc_record)
         db.commit()
 
-        text = DocumentProcessor.extract_text(file_path, doc_record.file_type)
-        if not text:
+        chunks = await _parse_document(file_path, doc_record.file_type)
+        if not chunks:
             logger.warning("No text extracted from %s", file_path)
             doc_record.processing_status = "failed"
             db.add(doc_record)
             db.commit()
             return
 
-        chunks = DocumentProcessor.chunk_text(text)
-
         embeddings = None
         if has_vector:
             embedding_service = EmbeddingService(user_id, db, api_key=api_key)
             embeddings = await embedding_service.embed_chunks(chunks)
 
+        # Every row carries the same keys so the INSERT batches as one
+        # executemany instead of one statement and commit per chunk
+        chunk_rows: list[dict[str, Any]] = []
         for i, content in enumerate(chunks):
             chunk_data: dict[str, Any] = {
                 "document_id": document_id,
                 "content": content,
             }
-            if embeddings and i < len(embeddings):
-                chunk_data["embedding"] = embeddings[i]
+            if embeddings:
+                chunk_data["embedding"] = (
+                    embeddings[i] if i < len(embeddings) else None
+                )
+            chunk_rows.append(chunk_data)
 
-            chunk_crud.create(db, obj_in=chunk_data)
+        chunk_crud.create_many(db, objs_in=chunk_rows)
 
         doc_record.processing_status = "completed"
         db.add(doc_record)
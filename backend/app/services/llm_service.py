@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_cerebras import ChatCerebras
@@ -12,7 +13,13 @@ from app.crud.user import user_api_key
 
 
 class LLMService:
+    # Seconds a user's available-model list is reused before re-checking keys
+    AVAILABLE_MODELS_TTL = 60
+    AVAILABLE_MODELS_MAX_ENTRIES = 10_000
+
     def __init__(self):
+        self._available_models_cache: Dict[int, Tuple[float, List[str]]] = {}
+
         # Mapping of providers to their API key parameter names
         self.provider_configs = {
             "Google": {"api_key_param": "google_api_key"},
@@ -127,12 +134,46 @@ class LLMService:
         user_id: Optional[int] = None,
         db: Optional[Session] = None,
     ):
+        cacheable = user_id is not None and db is not None
+        if cacheable:
+            entry = self._available_models_cache.get(user_id)
+            if entry:
+                if time.monotonic() - entry[0] < self.AVAILABLE_MODELS_TTL:
+                    return list(entry[1])
+                self._available_models_cache.pop(user_id, None)
+
         available = []
         for model_name, config in self.llm_configs.items():
             provider = config["provider"]
             if self.get_provider_key(provider, user_id, db):
                 available.append(model_name)
+
+        if cacheable:
+            now = time.monotonic()
+            if len(self._available_models_cache) >= self.AVAILABLE_MODELS_MAX_ENTRIES:
+                self._prune_available_models(now)
+            self._available_models_cache[user_id] = (now, available)
+            return list(available)
         return available
 
+    def _prune_available_models(self, now: float) -> None:
+        """Drop expired entries, or everything if the cache is still full."""
+        expired = [
+            user_id
+            for user_id, (cached_at, _) in self._available_models_cache.items()
+            if now - cached_at >= self.AVAILABLE_MODELS_TTL
+        ]
+        for user_id in expired:
+            del self._available_models_cache[user_id]
+        if len(self._available_models_cache) >= self.AVAILABLE_MODELS_MAX_ENTRIES:
+            self._available_models_cache.clear()
+
+    def invalidate_available_models(self, user_id: int) -> None:
+        """Forget a user's cached model list, e.g. after their API keys change."""
+        self._available_models_cache.pop(user_id, None)
+
+    def clear_available_models_cache(self) -> None:
+        self._available_models_cache.clear()
+
 
 llm_service = LLMService()
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
 from app.crud.session import session as session_crud
 from app.crud.message import message as message_crud
@@ -54,6 +55,8 @@ class ChatSessionService:
         limit: int = 100,
         newest_first: bool = True,
         search: str = None,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> List[dict]:
         """Get all sessions for a user with message counts"""
         sessions_with_counts = session_crud.get_by_user_with_message_count(
@@ -63,9 +66,30 @@ class ChatSessionService:
             limit=limit,
             newest_first=newest_first,
             search=search,
+            after_created_at=after_created_at,
+            after_id=after_id,
         )
         return sessions_with_counts
 
+    def get_user_sessions_page(
+        self,
+        db: Session,
+        user: User,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        search: str = None,
+    ) -> Tuple[List[dict], int]:
+        """Get one page of a user's sessions and the total session count"""
+        return session_crud.get_page_by_user_with_message_count(
+            db,
+            user_id=user.id,
+            skip=skip,
+            limit=limit,
+            newest_first=newest_first,
+            search=search,
+        )
+
     def get_session_by_id(
         self, db: Session, session_id: int, user: User
     ) -> Optional[dict]:
@@ -93,13 +117,11 @@ class ChatSessionService:
         self, db: Session, session_id: int, user: User, update_data: ChatSessionUpdate
     ) -> Optional[dict]:
         """Update a session for a user"""
-        session_obj = session_crud.get(db, id=session_id)
-        if not session_obj or session_obj.user_id != user.id:
-            return None
-
-        updated_session = session_crud.update(
-            db, db_obj=session_obj, obj_in=update_data
+        updated_session = session_crud.update_for_user(
+            db, id=session_id, user_id=user.id, obj_in=update_data
         )
+        if updated_session is None:
+            return None
 
         # Get message count for this session
         message_count = message_crud.count_by_user(
@@ -118,12 +140,9 @@ class ChatSessionService:
 
     def delete_session(self, db: Session, session_id: int, user: User) -> bool:
         """Delete a session for a user"""
-        session_obj = session_crud.get(db, id=session_id)
-        if not session_obj or session_obj.user_id != user.id:
+        if not session_crud.remove_for_user(db, id=session_id, user_id=user.id):
             return False
 
-        session_crud.remove(db, id=session_id)
-
         # Clean up in-memory session cache to prevent memory leaks
         if self._clear_session_memory_callback:
             try:
@@ -141,6 +160,8 @@ class ChatSessionService:
         skip: int = 0,
         limit: int = 100,
         newest_first: bool = True,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> List[dict]:
         """Get messages for a specific session"""
         session_obj = session_crud.get(db, id=session_id)
@@ -154,21 +175,54 @@ class ChatSessionService:
             skip=skip,
             limit=limit,
             newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
         )
 
-        return [
-            {
-                "id": msg.id,
-                "content": msg.content,
-                "response": msg.response,
-                "model": msg.model,
-                "user_id": msg.user_id,
-                "created_at": msg.created_at,
-                "images": msg.images,
-                "documents": msg.documents,
-            }
-            for msg in messages
-        ]
+        return [self._message_to_dict(msg) for msg in messages]
+
+    def get_session_messages_page(
+        self,
+        db: Session,
+        session_id: int,
+        user: User,
+        skip: int = 0,
+        limit: int = 100,
+        newest_first: bool = True,
+        after_created_at: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> Tuple[Optional[List[dict]], Optional[int]]:
+        """Get a page of a session's messages and the session's message total.
+
+        Returns ``(None, 0)`` if the session doesn't belong to the user. The
+        total is ``None`` for keyset pages.
+        """
+        messages, total = message_crud.get_page_by_session_for_user(
+            db,
+            session_id=session_id,
+            user_id=user.id,
+            skip=skip,
+            limit=limit,
+            newest_first=newest_first,
+            after_created_at=after_created_at,
+            after_id=after_id,
+        )
+        if messages is None:
+            return None, 0
+        return [self._message_to_dict(msg) for msg in messages], total
+
+    @staticmethod
+    def _message_to_dict(msg) -> dict:
+        return {
+            "id": msg.id,
+            "content": msg.content,
+            "response": msg.response,
+            "model": msg.model,
+            "user_id": msg.user_id,
+            "created_at": msg.created_at,
+            "images": msg.images,
+            "documents": msg.documents,
+        }
 
     def delete_session_messages(
         self,
@@ -178,10 +232,7 @@ class ChatSessionService:
         before_date: Optional[str] = None,
     ) -> int:
         """Delete messages in a session for a user"""
-        session_obj = session_crud.get(db, id=session_id)
-        if not session_obj or session_obj.user_id != user.id:
-            return 0
-
+        # Scoped by user_id, so another user's session deletes nothing
         return message_crud.delete_by_user(
             db, user_id=user.id, session_id=session_id, before_date=before_date
         )
@@ -0,0 +1,71 @@
+"""
+Conditional GET support.
+
+Builds JSON and file responses carrying a weak ``ETag`` and answers
+``304 Not Modified`` when the client already holds the same representation.
+"""
+
+import hashlib
+import os
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def etag_response(request: Request, payload: BaseModel | dict) -> Response:
+    """Serialize ``payload`` and return it with an ``ETag``, or a bare 304.
+
+    The tag is weak because ``GZipMiddleware`` may change the encoding of
+    the body, and it is a hash of the JSON so it changes whenever any
+    field does (including derived ones such as ``message_count``).
+    """
+    if isinstance(payload, BaseModel):
+        body = payload.model_dump_json().encode()
+    else:
+        body = orjson.dumps(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    # private/no-cache: the browser may keep it but must revalidate, and
+    # shared caches must not store per-user data
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def file_etag_response(
+    request: Request,
+    path: str,
+    *,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    max_age: int = 3600,
+) -> Response:
+    """Return ``path`` as a ``FileResponse`` with an ``ETag``, or a bare 304.
+
+    The tag comes from the file's mtime and size, so a revalidation costs a
+    ``stat`` rather than a read. Unlike JSON payloads the file is immutable
+    once uploaded, so the browser may reuse it for ``max_age`` seconds.
+    """
+    st = os.stat(path)
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    cache_headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=cache_headers)
+    return FileResponse(
+        path,
+        media_type=media_type,
+        headers={**(headers or {}), **cache_headers},
+        stat_result=st,
+    )
@@ -2,16 +2,22 @@
 Shared pagination utility.
 
 Computes pagination metadata consistently across all endpoints,
-eliminating the duplicated calculation pattern.
+eliminating the duplicated calculation pattern. Supports both skip/limit
+pagination and keyset pagination over ``(created_at, id)`` cursors.
 """
 
-from typing import Any, Dict
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def compute_pagination_meta(
     skip: int,
     limit: int,
     total_count: int,
+    rows: Optional[List[Any]] = None,
 ) -> Dict[str, Any]:
     """Compute standard pagination metadata from skip/limit pagination.
 
@@ -19,6 +25,9 @@ def compute_pagination_meta(
         skip: Number of records skipped.
         limit: Number of records per page.
         total_count: Total number of records matching the filter.
+        rows: The page rows, ordered by ``(created_at, id)``. When given, a
+            ``next_cursor`` key is added so clients can switch to keyset
+            pagination for the following pages.
 
     Returns:
         A dict with ``total``, ``page``, ``per_page``, ``total_pages``,
@@ -28,7 +37,7 @@ def compute_pagination_meta(
     total_pages = max((total_count + limit - 1) // limit, 1) if limit else 1
     has_more = (skip + limit) < total_count
 
-    return {
+    meta = {
         "total": total_count,
         "page": current_page,
         "per_page": limit,
@@ -37,3 +46,63 @@ def compute_pagination_meta(
         "skip": skip,
         "limit": limit,
     }
+    if rows is not None:
+        meta["next_cursor"] = (
+            encode_cursor(*_sort_key(rows[-1])) if has_more and rows else None
+        )
+    return meta
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode a ``(created_at, id)`` sort key as an opaque keyset cursor."""
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _sort_key(row: Any) -> Tuple[datetime, int]:
+    if isinstance(row, dict):
+        return row["created_at"], row["id"]
+    return row.created_at, row.id
+
+
+def compute_cursor_meta(
+    rows: List[Any],
+    limit: int,
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """Trim a ``limit + 1`` keyset page and build its pagination metadata.
+
+    Callers fetch one row more than ``limit``; its presence tells us there
+    is a next page without a separate ``COUNT(*)`` query.
+
+    Args:
+        rows: Up to ``limit + 1`` rows (ORM objects or dicts) ordered by
+            ``(created_at, id)``.
+        limit: Number of records per page.
+
+    Returns:
+        The page rows and a dict with ``per_page``, ``limit``, ``has_more``
+        and ``next_cursor`` keys.
+    """
+    has_more = len(rows) > limit
+    page = rows[:limit]
+    next_cursor = encode_cursor(*_sort_key(page[-1])) if has_more and page else None
+
+    return page, {
+        "per_page": limit,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "limit": limit,
+    }
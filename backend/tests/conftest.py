@@ -23,7 +23,8 @@ from app.main import app  # noqa: E402
 from app.database import Base, get_db  # noqa: E402
 from app.api.deps import clear_user_cache  # noqa: E402
 from app.models.user import User  # noqa: E402
-from app.core.security import get_password_hash  # noqa: E402
+from app.core.security import blacklist_filter, get_password_hash  # noqa: E402
+from app.services.llm_service import llm_service  # noqa: E402
 from app.schemas.user import UserCreate  # noqa: E402
 
 
@@ -42,6 +43,8 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 def db_session():
     """Create a new database session for each test."""
     clear_user_cache()
+    blacklist_filter.reset()
+    llm_service.clear_available_models_cache()
     # Drop all tables and recreate to ensure clean state
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
@@ -339,3 +339,206 @@ def test_delete_nonexistent_session(client: TestClient, test_user: User):
     response = client.delete("/api/v1/sessions/99999")
 
     assert response.status_code == 404
+
+
+def test_get_user_sessions_cursor_pagination(client: TestClient, test_user: User):
+    """Walking sessions with next_cursor visits every session exactly once."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    for i in range(5):
+        response = client.post("/api/v1/sessions", json={"title": f"Session {i}"})
+        assert response.status_code == 200
+
+    first = client.get("/api/v1/sessions", params={"limit": 2}).json()
+    assert first["meta"]["total"] == 5
+    seen = [s["id"] for s in first["data"]]
+    cursor = first["meta"]["next_cursor"]
+
+    while cursor:
+        page = client.get(
+            "/api/v1/sessions", params={"limit": 2, "cursor": cursor}
+        ).json()
+        assert "total" not in page["meta"]
+        seen.extend(s["id"] for s in page["data"])
+        cursor = page["meta"]["next_cursor"]
+        assert page["meta"]["has_more"] == (cursor is not None)
+
+    assert len(seen) == len(set(seen)) == 5
+
+
+def test_get_chat_history_rejects_invalid_cursor(client: TestClient, test_user: User):
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    response = client.get("/api/v1/chat/history", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_chat_renames_new_chat_session(client: TestClient, test_user: User):
+    """The first message still becomes the session title once the
+    background task has run."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    session_id = client.post("/api/v1/sessions", json={"title": "New Chat"}).json()["id"]
+
+    async def mock_simple_chat(*args, **kwargs):
+        yield "Hi!"
+
+    with patch("app.api.v1.chat.ai_service.simple_chat", new=mock_simple_chat), patch(
+        "app.api.v1.chat.ai_service.extract_and_save_memories", return_value=[]
+    ):
+        response = client.post(
+            f"/api/v1/chat?session_id={session_id}",
+            json={"content": "Plan a trip to Lisbon", "model": "gemini-2.5-flash"},
+        )
+    assert response.status_code == 200
+
+    session = client.get(f"/api/v1/sessions/{session_id}").json()
+    assert session["title"] == "Plan a trip to Lisbon"
+
+
+def test_get_session_honours_if_none_match(client: TestClient, test_user: User):
+    """An unchanged session is answered with 304; a change issues a new ETag."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    session_id = client.post("/api/v1/sessions", json={"title": "Cached"}).json()["id"]
+
+    first = client.get(f"/api/v1/sessions/{session_id}")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    cached = client.get(
+        f"/api/v1/sessions/{session_id}", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    client.put(f"/api/v1/sessions/{session_id}", json={"title": "Renamed"})
+    changed = client.get(
+        f"/api/v1/sessions/{session_id}", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["title"] == "Renamed"
+
+
+def test_chat_extracts_memories_in_background(client: TestClient, test_user: User):
+    """Memory extraction still runs for /chat, but after the reply rather
+    than as part of it."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    async def mock_simple_chat(*args, **kwargs):
+        yield "Noted."
+
+    with patch("app.api.v1.chat.ai_service.simple_chat", new=mock_simple_chat), patch(
+        "app.api.v1.chat.ai_service.extract_and_save_memories", return_value=["x"]
+    ) as mock_extract:
+        response = client.post(
+            "/api/v1/chat",
+            json={"content": "I live in Porto", "model": "gemini-2.5-flash"},
+        )
+
+    assert response.status_code == 200
+    mock_extract.assert_awaited_once_with(
+        "I live in Porto", test_user.id, "gemini-2.5-flash"
+    )
+
+
+def test_get_chat_history_filters_fields(client: TestClient, test_user: User):
+    """Unknown and unrequested fields are left out; mandatory ones stay."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    async def mock_simple_chat(*args, **kwargs):
+        yield "Hello!"
+
+    with patch("app.api.v1.chat.ai_service.simple_chat", new=mock_simple_chat), patch(
+        "app.api.v1.chat.ai_service.extract_and_save_memories", return_value=[]
+    ):
+        client.post(
+            "/api/v1/chat",
+            json={"content": "Hi there", "model": "gemini-2.5-flash"},
+        )
+
+    response = client.get(
+        "/api/v1/chat/history", params={"fields": "content,bogus,saved_memories"}
+    )
+    assert response.status_code == 200
+    message = response.json()["data"][0]
+    assert message["content"] == "Hi there"
+    assert message["response"] == "Hello!"
+    assert message["documents"] is None
+
+
+def test_transcribe_audio_passes_resolved_key(client: TestClient, test_user: User):
+    """The Groq key is looked up up front and the audio bytes are forwarded."""
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    client.post("/api/v1/auth/login", data=login_data)
+
+    async def mock_transcribe(audio_file, api_key, filename="audio.wav"):
+        assert audio_file == b"RIFF-audio"
+        assert api_key == "groq-key"
+        return "hello world"
+
+    with patch(
+        "app.api.v1.chat.llm_service.get_provider_key", return_value="groq-key"
+    ), patch("app.api.v1.chat.ai_service.transcribe_audio", new=mock_transcribe):
+        response = client.post(
+            "/api/v1/chat/transcribe",
+            files={"audio": ("clip.wav", b"RIFF-audio", "audio/wav")},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "hello world"}
+
+
+def test_preview_document_honours_if_none_match(
+    client: TestClient, test_user: User, db_session, tmp_path
+):
+    """PDF previews carry a stat-based ETag and revalidate with a 304."""
+    from app.models.document import SessionDocument
+
+    login_data = {"username": test_user.email, "password": "TestPassword123"}
+    client.post("/api/v1/auth/login", data=login_data)
+    session_id = client.post("/api/v1/sessions", json={"title": "Docs"}).json()["id"]
+
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4 preview")
+    doc = SessionDocument(
+        filename="doc.pdf",
+        file_type="pdf",
+        file_path=str(pdf),
+        session_id=session_id,
+        user_id=test_user.id,
+    )
+    db_session.add(doc)
+    db_session.commit()
+
+    first = client.get(f"/api/v1/chat/documents/{doc.id}/preview")
+    assert first.status_code == 200
+    assert first.content == b"%PDF-1.4 preview"
+    assert first.headers["Cache-Control"] == "private, max-age=3600"
+    etag = first.headers["ETag"]
+
+    cached = client.get(
+        f"/api/v1/chat/documents/{doc.id}/preview", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+
+def test_save_upload_replaces_atomically(tmp_path):
+    """Uploads are written beside the target and renamed into place."""
+    from io import BytesIO
+
+    from fastapi import UploadFile
+    from app.api.v1.chat import _save_upload
+
+    target = tmp_path / "1_doc.txt"
+    _save_upload(UploadFile(file=BytesIO(b"hello"), filename="doc.txt"), target)
+
+    assert target.read_bytes() == b"hello"
+    assert [p.name for p in tmp_path.iterdir()] == ["1_doc.txt"]
@@ -6,3 +6,29 @@ def test_get_available_models():
     with patch.object(service, "get_provider_key", side_effect=lambda p, u, d: "key" if p == "Google" else None):
         models = service.get_available_models(1, MagicMock())
         assert "gemini-2.5-flash" in models
+
+
+def test_get_available_models_is_cached_per_user():
+    service = LLMService()
+    with patch.object(service, "get_provider_key", return_value="key") as mock_key:
+        first = service.get_available_models(1, MagicMock())
+        calls = mock_key.call_count
+        assert service.get_available_models(1, MagicMock()) == first
+        assert mock_key.call_count == calls
+
+        service.invalidate_available_models(1)
+        service.get_available_models(1, MagicMock())
+        assert mock_key.call_count == calls * 2
+
+
+def test_available_models_cache_drops_expired_entries_when_full():
+    service = LLMService()
+    service.AVAILABLE_MODELS_MAX_ENTRIES = 2
+    with patch.object(service, "get_provider_key", return_value="key"), patch(
+        "app.services.llm_service.time.monotonic", return_value=0.0
+    ) as mock_now:
+        service.get_available_models(1, MagicMock())
+        service.get_available_models(2, MagicMock())
+        mock_now.return_value = service.AVAILABLE_MODELS_TTL + 1.0
+        service.get_available_models(3, MagicMock())
+    assert list(service._available_models_cache) == [3]
@@ -3,6 +3,7 @@ Unit tests for backend API endpoints with mocked AI services
 """
 
 from fastapi.testclient import TestClient
+from app.core.security import verify_token_claims
 from app.crud.user import user
 from app.schemas.user import UserCreate
 from sqlalchemy.orm import Session
@@ -15,6 +16,15 @@ def test_health_check(client: TestClient):
     assert response.status_code in [200, 404]
 
 
+def test_security_headers_are_added(client: TestClient):
+    """Every response carries the security headers, including error ones."""
+    for path in ("/health", "/api/v1/users/me"):
+        response = client.get(path)
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert "frame-ancestors 'none'" in response.headers["Content-Security-Policy"]
+
+
 def test_user_registration(client: TestClient, db_session: Session):
     """Test user registration endpoint"""
     # Test data
@@ -83,6 +93,11 @@ def test_get_current_user(client: TestClient, db_session: Session):
     data = response.json()
     assert data["email"] == user_data["email"]
 
+    cached = client.get(
+        "/api/v1/users/me", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
 
 def test_update_current_user_password(client: TestClient, db_session: Session):
     """Test updating the current user's password through the API."""
@@ -242,3 +257,213 @@ def test_logout(client: TestClient, db_session: Session):
     # After logout, accessing protected endpoint should fail
     protected_response = client.get("/api/v1/users/me")
     assert protected_response.status_code in [401, 403]  # Should be unauthorized now
+
+
+def test_token_blacklist_lookup_is_cached(client: TestClient, db_session: Session):
+    """Repeated requests with the same token are verified only once,
+    and logging out still revokes the token immediately."""
+    user_data = {
+        "email": "token_cache_test@example.com",
+        "password": "TestPassword123",
+        "username": "tokencachetest",
+    }
+    user.create(db_session, obj_in=UserCreate(**user_data))
+
+    login_data = {"username": user_data["email"], "password": user_data["password"]}
+    login_response = client.post("/api/v1/auth/login", data=login_data)
+    assert login_response.status_code == 200
+    token = client.cookies.get("access_token")
+
+    with patch(
+        "app.api.deps.verify_token_claims", wraps=verify_token_claims
+    ) as mock_verify:
+        assert client.get("/api/v1/users/me").status_code == 200
+        assert client.get("/api/v1/users/me").status_code == 200
+        assert mock_verify.call_count == 1
+
+    assert client.post("/api/v1/auth/logout").status_code == 200
+
+    client.cookies.set("access_token", token)
+    assert client.get("/api/v1/users/me").status_code == 401
+
+
+def test_cached_user_served_without_orm_instance(client: TestClient, db_session: Session):
+    """Cache hits return a CachedUser tuple and still serialize correctly."""
+    from app.api import deps
+
+    user_data = {
+        "email": "cached_user_test@example.com",
+        "password": "TestPassword123",
+        "username": "cachedusertest",
+    }
+    created_user = user.create(db_session, obj_in=UserCreate(**user_data))
+
+    login_data = {"username": user_data["email"], "password": user_data["password"]}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    first = client.get("/api/v1/users/me")
+    assert first.status_code == 200
+    assert isinstance(deps._get_cached_user(created_user.id), deps.CachedUser)
+
+    second = client.get("/api/v1/users/me")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+    update_response = client.patch(
+        "/api/v1/users/me/instructions",
+        json={"custom_instructions": "Be brief."},
+    )
+    assert update_response.status_code == 200
+    assert update_response.json()["custom_instructions"] == "Be brief."
+
+
+def test_login_warms_user_cache(client: TestClient, db_session: Session):
+    """The first authenticated request after login is served from the cache."""
+    from app.api import deps
+
+    user_data = {
+        "email": "warm_cache_test@example.com",
+        "password": "TestPassword123",
+        "username": "warmcachetest",
+    }
+    created_user = user.create(db_session, obj_in=UserCreate(**user_data))
+
+    login_data = {"username": user_data["email"], "password": user_data["password"]}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+    assert deps._get_cached_user(created_user.id) is not None
+
+    with patch("app.api.deps.user.get") as mock_get:
+        assert client.get("/api/v1/users/me").status_code == 200
+        mock_get.assert_not_called()
+
+
+def test_logout_all_revokes_existing_tokens(client: TestClient, db_session: Session):
+    """logout-all authenticates via the shared auth context and revokes
+    every token issued before it, even when the user is cached."""
+    user_data = {
+        "email": "logout_all_test@example.com",
+        "password": "TestPassword123",
+        "username": "logoutalltest",
+    }
+    user.create(db_session, obj_in=UserCreate(**user_data))
+
+    login_data = {"username": user_data["email"], "password": user_data["password"]}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+    token = client.cookies.get("access_token")
+    assert client.get("/api/v1/users/me").status_code == 200
+
+    response = client.post("/api/v1/auth/logout-all")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+    client.cookies.set("access_token", token)
+    assert client.get("/api/v1/users/me").status_code == 401
+
+
+def test_logout_all_requires_authentication(client: TestClient):
+    client.cookies.clear()
+    assert client.post("/api/v1/auth/logout-all").status_code == 401
+
+
+def test_gzip_stream_flushes_each_chunk():
+    """Every SSE chunk is decodable as soon as it is sent, and the whole
+    stream is a single valid gzip member."""
+    import asyncio
+    import gzip
+    import zlib
+    from app.api.v1.chat import _gzip_stream
+
+    events = [b"data: one\n\n", b"data: two\n\n", b"data: [DONE]\n\n"]
+
+    async def source():
+        for event in events:
+            yield event
+
+    async def collect():
+        return [part async for part in _gzip_stream(source())]
+
+    parts = asyncio.run(collect())
+
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for event, part in zip(events, parts):
+        assert decoder.decompress(part) == event
+    assert gzip.decompress(b"".join(parts)) == b"".join(events)
+
+
+def test_accepts_encoding_honours_qvalues():
+    from app.api.v1.chat import _accepts_encoding
+
+    assert _accepts_encoding("gzip, deflate, br", "gzip")
+    assert _accepts_encoding("br;q=1.0, gzip;q=0.5", "gzip")
+    assert _accepts_encoding("*", "gzip")
+    assert _accepts_encoding("zstd, gzip", "zstd")
+    assert not _accepts_encoding("gzip, br", "zstd")
+    assert not _accepts_encoding("gzip;q=0", "gzip")
+    assert not _accepts_encoding("gzip;q=0, *", "gzip")
+    assert not _accepts_encoding("identity", "gzip")
+    assert not _accepts_encoding("", "gzip")
+
+
+def test_zstd_stream_flushes_each_chunk():
+    """Each SSE chunk decodes on arrival and the stream is one zstd frame."""
+    import asyncio
+    import pytest
+
+    zstandard = pytest.importorskip("zstandard")
+    from app.api.v1.chat import _zstd_stream
+
+    events = [b"data: one\n\n", b"data: two\n\n", b"data: [DONE]\n\n"]
+
+    async def source():
+        for event in events:
+            yield event
+
+    async def collect():
+        return [part async for part in _zstd_stream(source())]
+
+    parts = asyncio.run(collect())
+
+    decoder = zstandard.ZstdDecompressor().decompressobj()
+    for event, part in zip(events, parts):
+        assert decoder.decompress(part) == event
+
+
+def test_ai_models_are_tested_concurrently(client: TestClient, db_session: Session):
+    """Each model gets its own result, and one failing model does not
+    affect the others."""
+    import asyncio
+
+    user_data = {
+        "email": "model_test@example.com",
+        "password": "TestPassword123",
+        "username": "modeltest",
+    }
+    user.create(db_session, obj_in=UserCreate(**user_data))
+    login_data = {"username": user_data["email"], "password": user_data["password"]}
+    assert client.post("/api/v1/auth/login", data=login_data).status_code == 200
+
+    running = 0
+    peak = 0
+
+    async def fake_simple_chat(text, model, user_id, db):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if model == "broken":
+            raise RuntimeError("boom")
+        yield f"{model} says "
+        yield "hi"
+
+    with patch(
+        "app.api.v1.chat.llm_service.get_available_models",
+        return_value=["fast", "broken"],
+    ), patch("app.api.v1.chat.ai_service.simple_chat", fake_simple_chat):
+        response = client.post("/api/v1/chat/models/test")
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results["fast"] == {"response": "fast says hi", "status": "success"}
+    assert results["broken"]["status"] == "error"
+    assert peak == 2
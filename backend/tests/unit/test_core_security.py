@@ -76,18 +76,62 @@ def test_verify_token_missing_claims():
 def test_verify_token_blacklisted():
     data = {"sub": "user_id"}
     token, jti = security.create_access_token(data)
+    security.blacklist_filter.reset()
 
     mock_db = MagicMock()
 
     # Patch the is_token_blacklisted function
     with patch(
+        "app.core.security.token_blacklist_crud.get_active_jtis",
+        return_value=[jti],
+    ), patch(
         "app.core.security.token_blacklist_crud.is_token_blacklisted"
     ) as mock_is_blacklisted:
         mock_is_blacklisted.return_value = True
         assert security.verify_token(token, db=mock_db) is None
         mock_is_blacklisted.assert_called_once()
+    security.blacklist_filter.reset()
 
 
+def test_verify_token_skips_db_lookup_when_not_in_filter():
+    data = {"sub": "user_id"}
+    token, _ = security.create_access_token(data)
+    security.blacklist_filter.reset()
+
+    mock_db = MagicMock()
+
+    with patch(
+        "app.core.security.token_blacklist_crud.get_active_jtis",
+        return_value=["some-other-jti"],
+    ) as mock_active, patch(
+        "app.core.security.token_blacklist_crud.is_token_blacklisted"
+    ) as mock_is_blacklisted:
+        assert security.verify_token(token, db=mock_db) == "user_id"
+        assert security.verify_token(token, db=mock_db) == "user_id"
+        mock_is_blacklisted.assert_not_called()
+        mock_active.assert_called_once()
+    security.blacklist_filter.reset()
+
+
+
+def test_blacklist_token_adds_jti_to_filter():
+    security.blacklist_filter.reset()
+    mock_db = MagicMock()
+
+    with patch(
+        "app.core.security.token_blacklist_crud.create_blacklist_entry"
+    ) as mock_create:
+        security.blacklist_token(
+            mock_db,
+            token_jti="revoked-jti",
+            user_id=None,
+            token_content="LOGOUT_BLACKLISTED",
+            reason="logout",
+        )
+        mock_create.assert_called_once()
+    assert "revoked-jti" in security.blacklist_filter._jtis
+    security.blacklist_filter.reset()
+
 def test_extract_token_jti():
     data = {"sub": "user_id"}
     token, jti = security.create_access_token(data)
@@ -135,3 +179,17 @@ def test_encryption_no_key():
         with patch.dict(os.environ, {"FERNET_KEY": ""}):
             with pytest.raises(ValueError):
                 security.encrypt_api_key("test")
+
+
+def test_decode_token_claims():
+    token, jti = security.create_access_token({"sub": "user_id"})
+    claims = security.decode_token_claims(token)
+    assert claims["jti"] == jti
+    assert security.claim_datetime(claims, "exp") == security.get_token_expires_at(
+        token
+    )
+
+
+def test_decode_token_claims_invalid():
+    assert security.decode_token_claims("invalid") == {}
+    assert security.claim_datetime({}, "exp") is None
@@ -5,6 +5,7 @@ Unit tests for backend CRUD operations
 from sqlalchemy.orm import Session
 from app.crud.user import user, user_api_key, user_mcp_server
 from app.crud.message import message
+from app.crud.token_blacklist import token_blacklist_crud
 from app.schemas.user import UserCreate, UserMCPServerCreate
 from app.schemas.message import MessageCreate
 
@@ -307,3 +308,62 @@ def test_create_user_mcp_server(db_session: Session):
     assert (
         created_mcp_server.mcp_servers_config == mcp_server_data["mcp_servers_config"]
     )
+
+
+def test_create_blacklist_entry_is_idempotent(db_session: Session):
+    """Blacklisting the same JTI twice keeps a single row"""
+    for _ in range(2):
+        token_blacklist_crud.create_blacklist_entry(
+            db_session,
+            token_jti="jti-123",
+            user_id=None,
+            token_content="LOGOUT_BLACKLISTED",
+        )
+
+    assert token_blacklist_crud.is_token_blacklisted(db_session, token_jti="jti-123")
+    assert token_blacklist_crud.get_active_jtis(db_session) == ["jti-123"]
+
+
+def test_purge_expired_blacklist_entries(db_session: Session):
+    """Only entries whose token has expired are purged"""
+    from datetime import datetime, timedelta, UTC
+
+    now = datetime.now(UTC)
+    entries = (
+        ("expired", now - timedelta(minutes=1)),
+        ("live", now + timedelta(minutes=30)),
+    )
+    for jti, expires_at in entries:
+        token_blacklist_crud.create_blacklist_entry(
+            db_session,
+            token_jti=jti,
+            user_id=None,
+            token_content="LOGOUT_BLACKLISTED",
+            expires_at=expires_at,
+        )
+
+    assert token_blacklist_crud.purge_expired(db_session) == 1
+    assert not token_blacklist_crud.is_token_blacklisted(
+        db_session, token_jti="expired"
+    )
+    assert token_blacklist_crud.is_token_blacklisted(db_session, token_jti="live")
+
+
+def test_search_history_deduplicates_repeated_queries(db_session: Session, test_user):
+    """Repeating a search keeps one row per (search_type, query)"""
+    from app.crud.search import search_history
+    from app.schemas.search import SearchHistoryCreate
+
+    first = search_history.create_with_user(
+        db_session, obj_in=SearchHistoryCreate(query="pgvector"), user_id=test_user.id
+    )
+    search_history.create_with_user(
+        db_session, obj_in=SearchHistoryCreate(query="fastapi"), user_id=test_user.id
+    )
+    again = search_history.create_with_user(
+        db_session, obj_in=SearchHistoryCreate(query="pgvector"), user_id=test_user.id
+    )
+
+    assert again.id == first.id
+    history = search_history.get_by_user(db_session, user_id=test_user.id)
+    assert sorted(h.query for h in history) == ["fastapi", "pgvector"]
@@ -45,3 +45,9 @@ def test_sanitize_user_input_with_pii():
     sanitized = sanitize_user_input(text)
     assert "[REDACTED_EMAIL]" in sanitized
     assert "test@example.com" not in sanitized
+
+
+def test_sanitize_filename():
+    assert InputSanitizer.sanitize_filename("../../etc/passwd") == ".._.._etc_passwd"
+    assert InputSanitizer.sanitize_filename("my report.pdf") == "my_report.pdf"
+    assert InputSanitizer.sanitize_filename("") == "unnamed"
@@ -64,3 +64,29 @@ def test_delete_memory(client: TestClient, test_user: User, db_session: Session)
     db_session.expire_all()
     db_memory = db_session.get(UserMemory, memory.id)
     assert db_memory is None
+
+
+def test_read_memories_cursor(client: TestClient, test_user: User, db_session: Session):
+    """A full page sets X-Next-Cursor, which returns the following page."""
+    db_session.add_all(
+        [UserMemory(user_id=test_user.id, content=f"Fact {i}") for i in range(3)]
+    )
+    db_session.commit()
+
+    client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user.email, "password": "TestPassword123"},
+    )
+
+    first = client.get("/api/v1/memories", params={"limit": 2})
+    assert first.status_code == 200
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/api/v1/memories", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert "X-Next-Cursor" not in second.headers
+    ids = [m["id"] for m in first.json()] + [m["id"] for m in second.json()]
+    assert len(set(ids)) == 3
+
+    bad = client.get("/api/v1/memories", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
@@ -102,6 +102,36 @@ def test_delete_message(db_session: Session, test_user: User):
     assert message is None
 
 
+def test_delete_by_user_returns_deleted_count(db_session: Session, test_user: User):
+    """Bulk delete is scoped to the session and reports the rows removed."""
+    from app.schemas.session import ChatSessionCreate
+
+    session = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Doomed"), user_id=test_user.id
+    )
+    for i in range(3):
+        crud.message.create(
+            db_session,
+            obj_in=MessageCreate(content=f"In session {i}", model="gpt-4"),
+            response="r",
+            user_id=test_user.id,
+            session_id=session.id,
+        )
+    crud.message.create(
+        db_session,
+        obj_in=MessageCreate(content="Elsewhere", model="gpt-4"),
+        response="r",
+        user_id=test_user.id,
+    )
+
+    deleted = crud.message.delete_by_user(
+        db_session, user_id=test_user.id, session_id=session.id
+    )
+
+    assert deleted == 3
+    assert crud.message.count_by_user(db_session, user_id=test_user.id) == 1
+
+
 def test_get_messages_by_user(db_session: Session, test_user: User):
     """Test retrieving all messages for a user."""
     # Create multiple messages for the user
@@ -213,3 +243,121 @@ def test_get_message_by_id_not_found(db_session: Session):
     message = crud.message.get(db_session, id=99999)  # Non-existent ID
 
     assert message is None
+
+
+def test_get_messages_by_user_keyset(db_session: Session, test_user: User):
+    """Seeking past (created_at, id) returns the next page without OFFSET."""
+    for i in range(5):
+        crud.message.create(
+            db_session,
+            obj_in=MessageCreate(content=f"Message {i}", model="gpt-4"),
+            response=f"Response {i}",
+            user_id=test_user.id,
+        )
+
+    first_page = crud.message.get_by_user(db_session, user_id=test_user.id, limit=2)
+    last = first_page[-1]
+    second_page = crud.message.get_by_user(
+        db_session,
+        user_id=test_user.id,
+        limit=2,
+        after_created_at=last.created_at,
+        after_id=last.id,
+    )
+    offset_page = crud.message.get_by_user(
+        db_session, user_id=test_user.id, skip=2, limit=2
+    )
+
+    assert [m.id for m in second_page] == [m.id for m in offset_page]
+    assert not {m.id for m in first_page} & {m.id for m in second_page}
+
+
+def test_get_page_by_user_returns_total(db_session: Session, test_user: User):
+    """The page query reports the full match count alongside the rows."""
+    for i in range(3):
+        crud.message.create(
+            db_session,
+            obj_in=MessageCreate(content=f"Message {i}", model="gpt-4"),
+            response=f"Response {i}",
+            user_id=test_user.id,
+        )
+
+    messages, total = crud.message.get_page_by_user(
+        db_session, user_id=test_user.id, limit=2
+    )
+    assert len(messages) == 2
+    assert total == 3
+
+    messages, total = crud.message.get_page_by_user(
+        db_session, user_id=test_user.id, skip=10, limit=2
+    )
+    assert messages == []
+    assert total == 3
+
+
+def test_create_message_with_ui_data(db_session: Session, test_user: User):
+    """Generated UI is stored by the INSERT itself, without a follow-up UPDATE."""
+    ui_data = {"type": "container", "children": []}
+    message = crud.message.create(
+        db_session,
+        obj_in=MessageCreate(content="Show a card", model="gpt-4"),
+        response="Here it is",
+        user_id=test_user.id,
+        ui_data=ui_data,
+    )
+
+    assert message.ui_data == ui_data
+
+
+def test_get_page_by_session_for_user(db_session: Session, test_user: User):
+    """Owned sessions page with a total; others' sessions come back as None."""
+    from app.schemas.session import ChatSessionCreate
+
+    session = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Mine"), user_id=test_user.id
+    )
+    for i in range(3):
+        crud.message.create(
+            db_session,
+            obj_in=MessageCreate(content=f"Message {i}", model="gpt-4"),
+            response="r",
+            user_id=test_user.id,
+            session_id=session.id,
+        )
+
+    rows, total = crud.message.get_page_by_session_for_user(
+        db_session, session_id=session.id, user_id=test_user.id, limit=2
+    )
+    assert len(rows) == 2
+    assert total == 3
+
+    rows, total = crud.message.get_page_by_session_for_user(
+        db_session, session_id=session.id, user_id=test_user.id, skip=10
+    )
+    assert rows == []
+    assert total == 3
+
+    rows, total = crud.message.get_page_by_session_for_user(
+        db_session, session_id=session.id, user_id=test_user.id + 1
+    )
+    assert rows is None
+
+
+def test_remove_if_owner(db_session: Session, test_user: User):
+    """Only the owner's delete removes the row."""
+    message = crud.message.create(
+        db_session,
+        obj_in=MessageCreate(content="Mine", model="gpt-4"),
+        response="r",
+        user_id=test_user.id,
+    )
+
+    assert not crud.message.remove_if_owner(
+        db_session, id=message.id, user_id=test_user.id + 1
+    )
+    assert crud.message.get_owner_id(db_session, id=message.id) == test_user.id
+
+    assert crud.message.remove_if_owner(
+        db_session, id=message.id, user_id=test_user.id
+    )
+    assert crud.message.get_owner_id(db_session, id=message.id) is None
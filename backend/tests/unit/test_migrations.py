@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.core import migrations
+from app.core.migrations import MigrationStatus
+
+
+def test_health_reports_migration_status(client):
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "migrations": "skipped"}
+
+
+def test_db_routes_rejected_while_migrations_running(client):
+    with patch.object(migrations, "migration_status", MigrationStatus.RUNNING):
+        response = client.get("/api/v1/sessions")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+
+        health = client.get("/health")
+        assert health.status_code == 200
+        assert health.json()["status"] == "starting"
+
+
+def test_failed_migration_sets_status():
+    with patch("alembic.command.upgrade", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            migrations.run_migrations()
+    assert migrations.migration_status == MigrationStatus.FAILED
+    migrations._set_status(MigrationStatus.SKIPPED)
+
+
+def test_lifespan_sizes_threadpool(client):
+    import anyio.to_thread
+    from app.core.config import settings
+
+    limiter = client.portal.call(anyio.to_thread.current_default_thread_limiter)
+    assert limiter.total_tokens == settings.THREADPOOL_SIZE
@@ -21,3 +21,20 @@ def test_chunk_text():
     assert len(chunks) > 1
     for chunk in chunks:
         assert len(chunk) <= 1000
+
+
+def test_extract_chunks_runs_in_process_pool():
+    from concurrent.futures import ProcessPoolExecutor
+    from app.services.document_processor import extract_chunks
+
+    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tf:
+        tf.write(b"B" * 2500)
+        tf_path = tf.name
+
+    try:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            chunks = pool.submit(extract_chunks, tf_path, "txt").result()
+        assert len(chunks) > 1
+        assert extract_chunks(tf_path, "unsupported") == []
+    finally:
+        os.unlink(tf_path)
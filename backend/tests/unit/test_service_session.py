@@ -96,9 +96,6 @@ def test_update_session(session_service):
     user.id = 1
     session_id = 101
 
-    mock_session_obj = MagicMock()
-    mock_session_obj.user_id = 1
-
     mock_updated_session = MagicMock()
     mock_updated_session.id = session_id
     mock_updated_session.title = "New Title"
@@ -106,18 +103,33 @@ def test_update_session(session_service):
     update_data = ChatSessionUpdate(title="New Title")
 
     with patch(
-        "app.services.session_service.session_crud.get", return_value=mock_session_obj
+        "app.services.session_service.session_crud.update_for_user"
+    ) as mock_update:
+        mock_update.return_value = mock_updated_session
+        with patch(
+            "app.services.session_service.message_crud.count_by_user",
+            return_value=0,
+        ):
+            result = session_service.update_session(db, session_id, user, update_data)
+            assert result["title"] == "New Title"
+            mock_update.assert_called_once_with(
+                db, id=session_id, user_id=user.id, obj_in=update_data
+            )
+
+
+def test_update_session_wrong_user(session_service):
+    db = MagicMock()
+    user = MagicMock()
+    user.id = 2
+
+    with patch(
+        "app.services.session_service.session_crud.update_for_user",
+        return_value=None,
     ):
-        with patch("app.services.session_service.session_crud.update") as mock_update:
-            mock_update.return_value = mock_updated_session
-            with patch(
-                "app.services.session_service.message_crud.count_by_user",
-                return_value=0,
-            ):
-                result = session_service.update_session(
-                    db, session_id, user, update_data
-                )
-                assert result["title"] == "New Title"
+        result = session_service.update_session(
+            db, 101, user, ChatSessionUpdate(title="Nope")
+        )
+        assert result is None
 
 
 def test_delete_session(session_service):
@@ -126,13 +138,10 @@ def test_delete_session(session_service):
     user.id = 1
     session_id = 101
 
-    mock_session_obj = MagicMock()
-    mock_session_obj.user_id = 1
-
     with patch(
-        "app.services.session_service.session_crud.get", return_value=mock_session_obj
-    ):
-        with patch("app.services.session_service.session_crud.remove") as mock_remove:
-            success = session_service.delete_session(db, session_id, user)
-            assert success is True
-            mock_remove.assert_called_once_with(db, id=session_id)
+        "app.services.session_service.session_crud.remove_for_user",
+        return_value=True,
+    ) as mock_remove:
+        success = session_service.delete_session(db, session_id, user)
+        assert success is True
+        mock_remove.assert_called_once_with(db, id=session_id, user_id=user.id)
@@ -1,3 +1,5 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 from app import crud
 from app.schemas.session import ChatSessionCreate, ChatSessionUpdate
@@ -149,3 +151,129 @@ def test_get_session_by_id_not_found(db_session: Session):
     session = crud.session.get(db_session, id=99999)  # Non-existent ID
 
     assert session is None
+
+
+def test_get_session_summary_raises_on_lazy_load(db_session: Session, test_user: User):
+    """get_summary loads the ownership/title columns and refuses lazy loads."""
+    created_session = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Summary"), user_id=test_user.id
+    )
+    db_session.expunge_all()
+
+    summary = crud.session.get_summary(db_session, id=created_session.id)
+
+    assert summary.user_id == test_user.id
+    assert summary.title == "Summary"
+    with pytest.raises(InvalidRequestError):
+        summary.messages
+    assert crud.session.get_summary(db_session, id=created_session.id + 1) is None
+
+
+def test_update_title_if_default(db_session: Session, test_user: User):
+    """Only sessions still titled 'New Chat' (or blank) get renamed."""
+    new_chat = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="New Chat"), user_id=test_user.id
+    )
+    named = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Kept"), user_id=test_user.id
+    )
+
+    assert crud.session.update_title_if_default(
+        db_session, id=new_chat.id, user_id=test_user.id, title="Hello"
+    )
+    assert not crud.session.update_title_if_default(
+        db_session, id=named.id, user_id=test_user.id, title="Hello"
+    )
+    assert not crud.session.update_title_if_default(
+        db_session, id=new_chat.id, user_id=test_user.id + 1, title="Other"
+    )
+
+    db_session.expire_all()
+    assert crud.session.get(db_session, id=new_chat.id).title == "Hello"
+    assert crud.session.get(db_session, id=named.id).title == "Kept"
+
+
+def test_get_by_user_with_message_count_counts_each_session(
+    db_session: Session, test_user: User
+):
+    """Each session reports its own message count, including empty ones."""
+    from app.schemas.message import MessageCreate
+
+    busy = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Busy"), user_id=test_user.id
+    )
+    crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Empty"), user_id=test_user.id
+    )
+    for i in range(2):
+        crud.message.create(
+            db_session,
+            obj_in=MessageCreate(content=f"Message {i}", model="gpt-4"),
+            response="r",
+            user_id=test_user.id,
+            session_id=busy.id,
+        )
+
+    sessions, total = crud.session.get_page_by_user_with_message_count(
+        db_session, user_id=test_user.id
+    )
+
+    assert total == 2
+    counts = {s["title"]: s["message_count"] for s in sessions}
+    assert counts == {"Busy": 2, "Empty": 0}
+
+
+def test_update_for_user_is_owner_scoped(db_session: Session, test_user: User):
+    """Only the owner's UPDATE matches; the row comes back updated."""
+    session = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Before"), user_id=test_user.id
+    )
+
+    assert (
+        crud.session.update_for_user(
+            db_session,
+            id=session.id,
+            user_id=test_user.id + 1,
+            obj_in=ChatSessionUpdate(title="Hijacked"),
+        )
+        is None
+    )
+
+    updated = crud.session.update_for_user(
+        db_session,
+        id=session.id,
+        user_id=test_user.id,
+        obj_in=ChatSessionUpdate(title="After"),
+    )
+    assert updated.title == "After"
+    assert crud.session.get(db_session, id=session.id).title == "After"
+
+
+def test_remove_for_user_deletes_session_and_messages(
+    db_session: Session, test_user: User
+):
+    """The owner's delete removes the session and its messages in bulk."""
+    from app.schemas.message import MessageCreate
+
+    session = crud.session.create(
+        db_session, obj_in=ChatSessionCreate(title="Doomed"), user_id=test_user.id
+    )
+    crud.message.create(
+        db_session,
+        obj_in=MessageCreate(content="Bye", model="gpt-4"),
+        response="r",
+        user_id=test_user.id,
+        session_id=session.id,
+    )
+
+    assert not crud.session.remove_for_user(
+        db_session, id=session.id, user_id=test_user.id + 1
+    )
+    assert crud.message.count_by_user(db_session, user_id=test_user.id) == 1
+
+    assert crud.session.remove_for_user(
+        db_session, id=session.id, user_id=test_user.id
+    )
+    db_session.expire_all()
+    assert crud.session.get(db_session, id=session.id) is None
+    assert crud.message.count_by_user(db_session, user_id=test_user.id) == 0
@@ -108,3 +108,19 @@ def test_get_existing_user_by_email(db_session: Session, test_user: User):
     assert existing_user is not None
     assert existing_user.id == test_user.id
     assert existing_user.email == test_user.email
+
+
+def test_api_key_upsert_replaces_existing_key(db_session: Session, test_user: User):
+    """Setting a key twice for the same provider keeps one row."""
+    from app.crud.user import user_api_key
+
+    first = user_api_key.upsert(
+        db_session, user_id=test_user.id, model_name="Google", encrypted_key="one"
+    )
+    second = user_api_key.upsert(
+        db_session, user_id=test_user.id, model_name="Google", encrypted_key="two"
+    )
+
+    assert second.id == first.id
+    keys = user_api_key.get_by_user(db_session, user_id=test_user.id)
+    assert [k.encrypted_key for k in keys] == ["two"]